@@ -10,19 +10,23 @@ Repo layout:
   /Proto-Defs        <-- .proto + .options
   /Proto-Host        <-- generated Python
   /Proto-Firmware    <-- generated NanoPB .c/.h + runtime (pb_*.c/.h)
-  /Proto-Necessities <-- requirements.txt
+  /Proto-Necessities <-- requirements.txt (+ codegen stamps, NanoPB download cache)
   genproto.py        <-- this script
 """
 
 import os
 import sys
+import re
+import json
+import hashlib
 import shutil
+import sysconfig
 import zipfile
 import urllib.request
-import io
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # ---------- Config ----------
 REQS = [
@@ -38,6 +42,8 @@ DIR_DEFS = ROOT / "Proto-Defs"
 DIR_HOST = ROOT / "Proto-Host"
 DIR_FW = ROOT / "Proto-Firmware"
 DIR_NEED = ROOT / "Proto-Necessities"
+DIR_NANOPB_CACHE = DIR_NEED / ".nanopb_cache"
+STAMPS_FILE = DIR_NEED / ".genproto.stamps.json"
 
 def _posix_rel(path: Path, start: Path) -> str:
     """Relative path from start, in POSIX form (forward slashes)."""
@@ -58,20 +64,42 @@ def _pip_install(pkgs: List[str], upgrade: bool = True) -> None:
         raise SystemExit("pip install failed.")
 
 def _pip_show(pkg: str) -> dict:
-    import subprocess
+    """
+    The `Version`/`Location` fields of `pip show <pkg>`, read in-process from the package metadata
+    (spawning pip costs a full interpreter startup per call).
+    """
+    from importlib import metadata
     try:
-        r = subprocess.run(
-            [sys.executable, "-m", "pip", "show", pkg],
-            capture_output=True, text=True, check=True
-        )
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"'pip show {pkg}' failed: {e}") from e
-    out = {}
-    for line in r.stdout.splitlines():
-        if ":" in line:
-            k, v = line.split(":", 1)
-            out[k.strip()] = v.strip()
-    return out
+        dist = metadata.distribution(pkg)
+    except metadata.PackageNotFoundError as e:
+        raise RuntimeError(f"'pip show {pkg}' failed: package not installed") from e
+    return {
+        "Version": dist.version,
+        "Location": str(Path(dist.locate_file(""))),
+    }
+
+def _dist_name(name: str) -> str:
+    """Normalized distribution name (PEP 503), with any extras/version specifier stripped."""
+    name = re.split(r"[\[<>=!~;\s]", name, maxsplit=1)[0]
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def _installed_dists() -> Dict[str, str]:
+    """Normalized name -> version of every installed distribution, from metadata alone (nothing gets imported)."""
+    from importlib import metadata
+    return {_dist_name(d.metadata["Name"]): d.version for d in metadata.distributions() if d.metadata["Name"]}
+
+def _release(version: str) -> Tuple[int, ...]:
+    """Numeric release part of a version ("2.0.0b7" -> (2, 0, 0)); pre-release tags are ignored, so the 2.0 betterproto betas count as 2.0.0."""
+    m = re.match(r"\d+(?:\.\d+)*", version)
+    return tuple(int(x) for x in m.group(0).split(".")) if m else ()
+
+def _req_satisfied(req: str, installed: Dict[str, str]) -> bool:
+    """Whether `req` is installed at (at least) its `>=` minimum version."""
+    version = installed.get(_dist_name(req))
+    if version is None:
+        return False
+    m = re.search(r">=\s*([\w.]+)", req)
+    return m is None or _release(version) >= _release(m.group(1))
 
 def ensure_layout():
     DIR_HOST.mkdir(parents=True, exist_ok=True)
@@ -79,7 +107,35 @@ def ensure_layout():
     DIR_NEED.mkdir(parents=True, exist_ok=True)
     (DIR_NEED / "requirements.txt").write_text("\n".join(REQS) + "\n")
 
+# resolved plugin lookups, reused by later calls in the same run (ensure_deps probes, generate_for resolves again)
+# only successful lookups are cached, so a probe that fails before an install still re-checks afterwards
+_NANOPB_PLUGIN_INFO: Optional[Tuple[Path, str, Path]] = None
+_BETTERPROTO_PLUGIN: Optional[Path] = None
+
+def _find_plugin(names: List[str], location: Path) -> Optional[Path]:
+    """
+    Look for a protoc plugin executable: known script dirs first (cheap stat calls),
+    then a single PATH search as the fallback. Stops at the first hit.
+    """
+    ext = ".exe" if os.name == "nt" else ""
+    # this interpreter's script dir (where pip put the entry point), then the usual venv layout next to the package
+    bases = [Path(sysconfig.get_path("scripts")), location.parent / ("Scripts" if os.name == "nt" else "bin")]
+    for base in bases:
+        for nm in names:
+            cand = base / f"{nm}{ext}"
+            if cand.exists():
+                return cand.resolve()
+    for nm in names:
+        found = shutil.which(nm)
+        if found:
+            return Path(found).resolve()
+    return None
+
 def find_nanopb_plugin_and_version() -> Tuple[Path, str, Path]:
+    global _NANOPB_PLUGIN_INFO
+    if _NANOPB_PLUGIN_INFO is not None:
+        return _NANOPB_PLUGIN_INFO
+
     info = _pip_show("nanopb")
     version = info.get("Version")
     if not version:
@@ -87,65 +143,47 @@ def find_nanopb_plugin_and_version() -> Tuple[Path, str, Path]:
     location = Path(info.get("Location", "")).resolve()
     if not location:
         raise RuntimeError("nanopb installed but pip didn't return Location.")
-    base = location.parent
 
-    # usual venv layout
-    if os.name == "nt":
-        plugin = base / "Scripts" / "protoc-gen-nanopb.exe"
-    else:
-        plugin = base / "bin" / "protoc-gen-nanopb"
-
-    if not plugin.exists():
-        found = shutil.which("protoc-gen-nanopb")
-        if found:
-            plugin = Path(found)
-        else:
-            raise RuntimeError(f"Could not find protoc-gen-nanopb at {plugin}")
+    plugin = _find_plugin(["protoc-gen-nanopb"], location)
+    if plugin is None:
+        raise RuntimeError(f"Could not find protoc-gen-nanopb near {location} or on PATH")
 
-    return plugin.resolve(), version, location
+    _NANOPB_PLUGIN_INFO = (plugin, version, location)
+    return _NANOPB_PLUGIN_INFO
 
 def find_betterproto_plugin() -> Path:
+    global _BETTERPROTO_PLUGIN
+    if _BETTERPROTO_PLUGIN is not None:
+        return _BETTERPROTO_PLUGIN
+
     info = _pip_show("betterproto")
     location = Path(info.get("Location", "")).resolve()
-    base = location.parent
-    names = ["protoc-gen-python_betterproto", "protoc-gen-python-betterproto"]
-    exts = [".exe"] if os.name == "nt" else [""]
+    plugin = _find_plugin(["protoc-gen-python_betterproto", "protoc-gen-python-betterproto"], location)
+    if plugin is None:
+        raise RuntimeError(
+            "Could not locate BetterProto plugin (protoc-gen-python_betterproto). "
+            "Try: py -m pip install --upgrade \"betterproto[compiler]>=2.0.0\""
+        )
 
-    cands: List[Path] = []
-    for nm in names:
-        for ext in exts:
-            if os.name == "nt":
-                cands.append(base / "Scripts" / f"{nm}{ext}")
-            else:
-                cands.append(base / "bin" / f"{nm}{ext}")
-    for nm in names:
-        w = shutil.which(nm)
-        if w:
-            cands.append(Path(w))
-    for c in cands:
-        if c and c.exists():
-            return c.resolve()
-    raise RuntimeError(
-        "Could not locate BetterProto plugin (protoc-gen-python_betterproto). "
-        "Try: py -m pip install --upgrade \"betterproto[compiler]>=2.0.0\""
-    )
+    _BETTERPROTO_PLUGIN = plugin
+    return _BETTERPROTO_PLUGIN
 
 def ensure_deps():
-    import importlib.util
-    if importlib.util.find_spec("betterproto") is None:
-        _pip_install(["betterproto>=2.0.0"])
-    try:
-        _ = find_betterproto_plugin()
-    except RuntimeError:
-        _pip_install(["betterproto[compiler]>=2.0.0"])
-    if importlib.util.find_spec("grpclib") is None:
-        _pip_install(["grpclib>=0.4"])
-    try:
-        from grpc_tools import protoc as _  # noqa
-    except Exception:
-        _pip_install(["grpcio-tools>=1.56"])
-    if importlib.util.find_spec("nanopb") is None:
-        _pip_install(["nanopb>=0.4"])
+    # one metadata scan per run (cheap, nothing gets imported), so uninstalls/downgrades are always caught
+    installed = _installed_dists()
+    missing = [req for req in REQS if not _req_satisfied(req, installed)]
+
+    # betterproto can be present without its compiler extra (no protoc plugin)
+    betterproto_req = next(req for req in REQS if _dist_name(req) == "betterproto")
+    if betterproto_req not in missing:
+        try:
+            _ = find_betterproto_plugin()
+        except RuntimeError:
+            missing.append(betterproto_req)
+
+    # single pip invocation for everything that's missing
+    if missing:
+        _pip_install(missing)
 
 def fetch_nanopb_runtime(version: str):
     needed = [
@@ -157,20 +195,32 @@ def fetch_nanopb_runtime(version: str):
     if all((DIR_FW / n).exists() for n in needed):
         print(">> NanoPB runtime already present in Proto-Firmware.")
         return
-    url = f"https://github.com/nanopb/nanopb/archive/refs/tags/{version}.zip"
-    print(f">> Downloading NanoPB runtime {version} from {url}")
-    try:
-        with urllib.request.urlopen(url) as resp:
-            data = resp.read()
-    except Exception as e:
-        raise RuntimeError(f"Failed to download NanoPB {version} release: {e}")
-    with zipfile.ZipFile(io.BytesIO(data)) as z:
+    # release archives are cached per-version so a clean + regenerate doesn't hit the network again
+    cached_zip = DIR_NANOPB_CACHE / version / f"nanopb-{version}.zip"
+    if cached_zip.exists():
+        print(f">> Using cached NanoPB runtime {version} from {cached_zip}")
+    else:
+        url = f"https://github.com/nanopb/nanopb/archive/refs/tags/{version}.zip"
+        print(f">> Downloading NanoPB runtime {version} from {url}")
+        # stream straight to disk (never holding the whole archive in memory), into a temp name
+        # so an interrupted download can't be mistaken for a valid cache entry next run
+        cached_zip.parent.mkdir(parents=True, exist_ok=True)
+        partial_zip = cached_zip.with_name(cached_zip.name + ".part")
+        try:
+            with urllib.request.urlopen(url) as resp, open(partial_zip, "wb") as dst:
+                shutil.copyfileobj(resp, dst, length=1 << 20)
+        except Exception as e:
+            partial_zip.unlink(missing_ok=True)
+            raise RuntimeError(f"Failed to download NanoPB {version} release: {e}")
+        os.replace(partial_zip, cached_zip)
+    with zipfile.ZipFile(cached_zip) as z:
         prefix = f"nanopb-{version}/"
         for name in needed:
             arcname = prefix + name
             try:
+                # 1 MiB chunks, same as the download; extractall() would keep the nanopb-<ver>/ prefix dir
                 with z.open(arcname) as src, open(DIR_FW / name, "wb") as dst:
-                    shutil.copyfileobj(src, dst)
+                    shutil.copyfileobj(src, dst, length=1 << 20)
                     print(f">> Wrote {name}")
             except KeyError:
                 print(f"!! {name} not found in release archive {version}")
@@ -190,8 +240,14 @@ def pushd(path: Path):
         os.chdir(prev)
 
 #IG: clean ALL files from directories
+#NOTE: Proto-Necessities (and the NanoPB download cache inside it) is intentionally left alone,
+#      except for the codegen stamps--without outputs those would wrongly report everything up to date
 def clean():
     removed = 0
+    try:
+        STAMPS_FILE.unlink()
+    except FileNotFoundError:
+        pass
     for f in DIR_HOST.glob("*"):
         try:
             f.unlink(); removed += 1
@@ -204,6 +260,41 @@ def clean():
             pass
     print(f">> Cleaned {removed} generated files.")
 
+def _load_stamps() -> dict:
+    try:
+        return json.loads(STAMPS_FILE.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def _save_stamps(stamps: dict) -> None:
+    STAMPS_FILE.write_text(json.dumps(stamps, indent=2, sort_keys=True) + "\n")
+
+def _defs_digest() -> str:
+    """
+    sha256 over every .proto and .options in Proto-Defs (names + contents).
+    Generated code also depends on whatever a proto imports (message sizes, struct layouts),
+    so any definition change marks every proto stale instead of tracking the import graph.
+    """
+    h = hashlib.sha256()
+    for f in sorted([*DIR_DEFS.glob("*.proto"), *DIR_DEFS.glob("*.options")]):
+        h.update(f.name.encode())
+        h.update(b"\0")
+        h.update(f.read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()
+
+def _nanopb_outputs(proto_rel: str) -> List[Path]:
+    stem = Path(proto_rel).with_suffix("")
+    return [DIR_FW / f"{stem}.pb.c", DIR_FW / f"{stem}.pb.h"]
+
+_PACKAGE_RE = re.compile(r"^\s*package\s+([\w.]+)\s*;", re.MULTILINE)
+
+def _betterproto_outputs(proto: Path) -> List[Path]:
+    """BetterProto emits one module per proto package: Proto-Host/<package dirs>/__init__.py."""
+    m = _PACKAGE_RE.search(proto.read_text(encoding="utf-8", errors="replace"))
+    package_dir = DIR_HOST.joinpath(*m.group(1).split(".")) if m else DIR_HOST
+    return [package_dir / "__init__.py"]
+
 def discover_protos(selected: Optional[List[str]] = None) -> List[Path]:
     if selected:
         out = []
@@ -217,46 +308,80 @@ def discover_protos(selected: Optional[List[str]] = None) -> List[Path]:
         return out
     return sorted(DIR_DEFS.glob("*.proto"))
 
-def generate_for(protos: List[Path], diagnose: bool = False):
-    clean()
-
-    nanopb_plugin, nanopb_version, _ = find_nanopb_plugin_and_version()
-    betterproto_plugin = find_betterproto_plugin()
-    bp_version = _pip_show("betterproto").get("Version", "unknown")
-    if diagnose:
-        print(f">> Using nanopb plugin exe: {nanopb_plugin}")
-        print(f">> Using NanoPB version: {nanopb_version}")
-        print(f">> Using BetterProto plugin exe: {betterproto_plugin}")
-        print(f">> Detected BetterProto version: {bp_version}")
-
-    fetch_nanopb_runtime(nanopb_version)
-
-    # Use POSIX relative paths to avoid Windows colon issues and to tolerate spaces.
-    inc_dir_rel = _posix_rel(DIR_DEFS, ROOT)
-    out_py_rel  = _posix_rel(DIR_HOST, ROOT)
-    out_c_rel   = _posix_rel(DIR_FW, ROOT)
-
-    # Build proto file list relative to Proto-Defs (so includes are clean)
-    proto_rels = [Path(os.path.relpath(p, DIR_DEFS)).as_posix() for p in protos]
-
-    # Compose common args
-    common_inc = ["-I", inc_dir_rel]
+def generate_for(protos: List[Path], diagnose: bool = False, force: bool = False, parallel: bool = False):
+    # plugin lookups, version probes and the NanoPB runtime fetch are all independent + I/O bound,
+    # so overlap them on a small thread pool instead of paying for each one back to back
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        nanopb_info_future = pool.submit(find_nanopb_plugin_and_version)
+        betterproto_plugin_future = pool.submit(find_betterproto_plugin)
+        bp_version_future = pool.submit(lambda: _pip_show("betterproto").get("Version", "unknown"))
+        nanopb_plugin, nanopb_version, _ = nanopb_info_future.result()
+        betterproto_plugin = betterproto_plugin_future.result()
+        bp_version = bp_version_future.result()
+        if diagnose:
+            print(f">> Using nanopb plugin exe: {nanopb_plugin}")
+            print(f">> Using NanoPB version: {nanopb_version}")
+            print(f">> Using BetterProto plugin exe: {betterproto_plugin}")
+            print(f">> Detected BetterProto version: {bp_version}")
+
+        # Stamps record what the definitions (every .proto + .options) looked like when each proto's outputs were generated.
+        # A plugin upgrade (or --force) invalidates everything: clean + full rebuild, like we always used to.
+        # The clean also drops the NanoPB runtime, so it gets re-fetched for the new version below.
+        versions = {"betterproto": bp_version, "nanopb": nanopb_version}
+        stamps = _load_stamps()
+        if force or stamps.get("versions") != versions:
+            clean()
+            stamps = {}
+        stamps["versions"] = versions
+        proto_stamps: Dict[str, str] = stamps.setdefault("protos", {})
+
+        # BetterProto doesn't need the NanoPB runtime, so let the fetch run alongside it;
+        # only the NanoPB stage below has to wait on it
+        runtime_future = pool.submit(fetch_nanopb_runtime, nanopb_version)
+
+        # Use POSIX relative paths to avoid Windows colon issues and to tolerate spaces.
+        inc_dir_rel = _posix_rel(DIR_DEFS, ROOT)
+        out_py_rel  = _posix_rel(DIR_HOST, ROOT)
+        out_c_rel   = _posix_rel(DIR_FW, ROOT)
+
+        # Build proto file list relative to Proto-Defs (so includes are clean)
+        proto_rels = [Path(os.path.relpath(p, DIR_DEFS)).as_posix() for p in protos]
+
+        # figure out which protos changed (or lost any of their outputs) since their outputs were generated
+        defs_digest = _defs_digest()
+        stale_rels = [
+            pr for p, pr in zip(protos, proto_rels)
+            if proto_stamps.get(pr) != defs_digest
+            or not all(o.exists() for o in [*_nanopb_outputs(pr), *_betterproto_outputs(p)])
+        ]
+        if not stale_rels:
+            runtime_future.result()
+            print(">> Generated code is up to date (use --force to regenerate anyway).")
+            return
+
+        # drop outputs of stale protos so nothing lingers if a message/file got removed
+        for pr in stale_rels:
+            for out in _nanopb_outputs(pr):
+                try:
+                    out.unlink()
+                except FileNotFoundError:
+                    pass
+
+        # Compose common args
+        common_inc = ["-I", inc_dir_rel]
 
-    with pushd(ROOT):
         # ---- BetterProto (Python) ----
-        for pr in proto_rels:
-            print(f">> Generating Python (BetterProto) for {pr}")
-            py_args = [
-                "protoc",
-                *common_inc,
-                f"--plugin=protoc-gen-python_betterproto={betterproto_plugin}",
-                f"--python_betterproto_out={out_py_rel}",
-                pr,
-            ]
-            if diagnose:
-                print("   protoc args:", py_args)
-            if protoc(py_args) != 0:
-                raise SystemExit(f"BetterProto codegen failed for {pr}")
+        # protoc accepts every .proto in one call and hands all of them to the plugin at once,
+        # so we only pay the import parsing + plugin startup cost a single time
+        # NOTE: BetterProto emits one module per proto *package*, not per file--regenerating only the
+        #       stale files would drop messages from their unchanged package siblings. Always pass the full set.
+        py_args = [
+            "protoc",
+            *common_inc,
+            f"--plugin=protoc-gen-python_betterproto={betterproto_plugin}",
+            f"--python_betterproto_out={out_py_rel}",
+            *proto_rels,
+        ]
 
         # ---- NanoPB (C) ----
         # IMPORTANT: on Windows, keep --nanopb_out as a bare directory (no embedded options),
@@ -268,21 +393,47 @@ def generate_for(protos: List[Path], diagnose: bool = False):
         plugin_nanopb = f"--plugin=protoc-gen-nanopb={nanopb_plugin}"
         nanopb_out    = f"--nanopb_out={out_c_rel}"
 
-        for pr in proto_rels:
-            print(f">> Generating NanoPB C for {pr}")
-            c_args = [
-                "protoc",
-                *common_inc,
-                plugin_nanopb,
-                nanopb_out,
-                # pass each option via separate --nanopb_opt=...
-                *[f"--nanopb_opt={opt}" for opt in base_opts],
-                pr,
-            ]
+        c_args = [
+            "protoc",
+            *common_inc,
+            plugin_nanopb,
+            nanopb_out,
+            # pass each option via separate --nanopb_opt=...
+            *[f"--nanopb_opt={opt}" for opt in base_opts],
+            *stale_rels,
+        ]
+
+        def run_betterproto() -> None:
+            print(f">> Generating Python (BetterProto) for {', '.join(proto_rels)}")
+            if diagnose:
+                print("   protoc args:", py_args)
+            if protoc(py_args) != 0:
+                raise SystemExit(f"BetterProto codegen failed for {', '.join(proto_rels)}")
+
+        def run_nanopb() -> None:
+            # runtime fetch has to have landed before we generate against it (re-raises download errors)
+            runtime_future.result()
+            print(f">> Generating NanoPB C for {', '.join(stale_rels)}")
             if diagnose:
                 print("   protoc args:", c_args)
             if protoc(c_args) != 0:
-                raise SystemExit(f"NanoPB codegen failed for {pr}")
+                raise SystemExit(f"NanoPB codegen failed for {', '.join(stale_rels)}")
+
+        with pushd(ROOT):
+            if parallel:
+                # the two plugins write to disjoint output dirs, so there's no ordering between them
+                # (both share the pushd above--don't chdir anywhere inside the stages)
+                stage_futures = [pool.submit(run_betterproto), pool.submit(run_nanopb)]
+                wait(stage_futures)
+                for stage in stage_futures:
+                    stage.result()  # re-raise the first failure
+            else:
+                run_betterproto()
+                run_nanopb()
+
+    # only stamp once both plugins succeeded
+    proto_stamps.update(dict.fromkeys(stale_rels, defs_digest))
+    _save_stamps(stamps)
 
 def main(argv: List[str]):
     import argparse
@@ -293,6 +444,8 @@ def main(argv: List[str]):
     ap.add_argument("--install", action="store_true", help="(Re)install required Python packages and exit.")
     ap.add_argument("--proto", nargs="+", help="Only (re)generate these .proto files (by filename).")
     ap.add_argument("--diagnose", action="store_true", help="Print diagnostic info and exact protoc args.")
+    ap.add_argument("--force", action="store_true", help="Clean and regenerate everything, even if nothing changed.")
+    ap.add_argument("-j", "--parallel", action="store_true", help="Run the BetterProto and NanoPB stages concurrently.")
     args = ap.parse_args(argv)
 
     ensure_layout()
@@ -320,7 +473,7 @@ def main(argv: List[str]):
     if missing_opts:
         print(">> Note: No .options found for:", ", ".join(missing_opts))
 
-    generate_for(protos, diagnose=args.diagnose)
+    generate_for(protos, diagnose=args.diagnose, force=args.force, parallel=args.parallel)
     print("\n✅ Done.")
     print(f" - Python (BetterProto): {DIR_HOST.resolve()}")
     print(f" - Firmware (NanoPB):   {DIR_FW.resolve()} (runtime + generated .c/.h)")
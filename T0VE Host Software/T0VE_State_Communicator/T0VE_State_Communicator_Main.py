@@ -15,7 +15,7 @@ This is basically a GUI wrapper around the raw protobuf messages. To use:
 from mimetypes import init
 import tkinter as tk
 from tkinter import ttk
-from typing import List
+from typing import List, Optional
 import logging
 from pubsub import pub
 import pprint
@@ -34,26 +34,26 @@ from T0VE_State_Communicator.tsc_dispatcher import *
 def connection_prompt(  root: tk.Tk, 
                         options: List[str], 
                         title: str = "T0VE State Communicator - Select Node", 
-                        prompt: str = "Select which node you'd like to communicate with:") -> str:
+                        prompt: str = "Select which node you'd like to communicate with:") -> Optional[str]:
     """
-    Displays a modal selection dialog with given options. 
+    Displays a modal selection dialog with given options, as a Toplevel over `root`
+    (root can stay withdrawn, and gets reused for the main window afterwards).
     Blocks until user makes a selection and clicks OK (or presses Enter).
-    Returns the selected value as a string.
+    Returns the selected value as a string, or None if the dialog was closed.
     """
-    # Create a Toplevel for modal dialog if root already shown, else use root
-    root.title(title)
-    root.resizable(False, False)  # Make the window non-resizeable
+    dialog = tk.Toplevel(root)
+    dialog.title(title)
+    dialog.resizable(False, False)  # Make the window non-resizeable
 
-    selected_var = tk.StringVar(value=options[0])
+    selected_var = tk.StringVar(master=dialog, value=options[0])
     selection = {"value": None}
 
     def submit():
         selection["value"] = selected_var.get()
-        root.quit()     # ends mainloop for this window only
-        root.destroy()  # closes the window
+        dialog.destroy()  # closes the dialog, releases the wait below
 
     # Frame for alignment
-    row_frame = ttk.Frame(root)
+    row_frame = ttk.Frame(dialog)
     row_frame.pack(pady=30, padx=30)
 
     prompt_label = ttk.Label(row_frame, text=prompt)
@@ -66,13 +66,11 @@ def connection_prompt(  root: tk.Tk,
     launch_btn.pack(side="left")
 
     # Enter key submits
-    root.bind("<Return>", lambda event: submit())
+    dialog.bind("<Return>", lambda event: submit())
 
-    # themeing using sv-ttk
-    sv_ttk.set_theme("light")
-
-    # Run this window's event loop until selection
-    root.mainloop()
+    # Block until the dialog is gone (OK/Enter, or closed via the window manager)
+    dialog.focus_force()
+    root.wait_window(dialog)
 
     return selection["value"]
 
@@ -88,8 +86,13 @@ if __name__ == "__main__":
         )
         logger.addHandler(handler)
 
-    #start by launching a GUI window asking for the node name
+    # single Tk root for the whole app (Tcl/ttk/theme only load once)
+    # keep it hidden while the node selection dialog is up
     root = tk.Tk()
+    root.withdraw()
+    sv_ttk.set_theme("light")
+
+    #start by launching a GUI window asking for the node name
     node_options = ["0", "1", "2", "3", "4", "15", "Any"]
     selected = connection_prompt(
         root,
@@ -99,6 +102,7 @@ if __name__ == "__main__":
     )
     if selected is None:
         logger.error("No node selected, exiting...")
+        root.destroy()
         exit()
     
     # figure out all the root topics as necessary
@@ -129,7 +133,6 @@ if __name__ == "__main__":
     # 2) state of the selected node as a dict viewer (right on the window, rest of the width)
     # 3) debug messages as a scrollable textbox (bottom of the window, min height (may be adjustable), rest of the width)
 
-    root = tk.Tk()
     root.title("T0VE State Communicator")
 
     # Create a PanedWindow (main container) with vertical split: top/bottom
@@ -141,12 +144,17 @@ if __name__ == "__main__":
     main_pane.add(top_pane, stretch="always", minsize=200)
 
     ###### PORT STATUS ######
-    editable_port_paths = [key for key in FlatDict.flatten(DEFAULT_PORT_STATE()).keys() if "command" in key]
+    # build the default port state once; the same copy seeds both the editable paths and the viewer
+    # flattened once here and handed to the viewer so it doesn't walk the dict again
+    default_port_state = DEFAULT_PORT_STATE()
+    port_state_flat = FlatDict.flatten(default_port_state)
+    editable_port_paths = [path for path in port_state_flat if "command" in path]
     logger.info(f"Editable port paths: {editable_port_paths}")
 
     port_status_frame = ScrollableFrame(top_pane)
     port_status_dict_viewer = DictViewerModule(
-        reference_dict=DEFAULT_PORT_STATE(),
+        reference_dict=default_port_state,
+        flat_reference_dict=port_state_flat,
         editable_paths=editable_port_paths,
         layout_pattern="vv",
         parent=port_status_frame.interior,
@@ -162,9 +170,12 @@ if __name__ == "__main__":
     initial_node_state = NodeStateDefaults.default_all_no_eeprom()
     initial_node_state_dict = initial_node_state.to_dict(include_default_values=True)
     
-    #flatten our default state, create editable paths
-    paths = FlatDict.flatten(initial_node_state_dict).keys()
-    paths_editable = [path for path in paths if any("command" in str(p) for p in path)]
+    #flatten our default state, create editable paths (single pass over the flattened paths)
+    node_state_flat = FlatDict.flatten(initial_node_state_dict)
+    paths_editable = [
+        path for path in node_state_flat
+        if any("command" in str(p) for p in path)
+    ]
     paths_editable.append(("doSystemReset",))
     paths_editable.remove(('comms', 'command', 'allowConnection')) #don't let the user disable connections, will lock out until reset
 
@@ -172,6 +183,7 @@ if __name__ == "__main__":
     node_state_frame = ScrollableFrame(top_pane)
     node_state_dict_viewer = DictViewerModule(
         reference_dict=initial_node_state_dict,
+        flat_reference_dict=node_state_flat,
         editable_paths=paths_editable,
         layout_pattern="thvv",
         parent=node_state_frame.interior,
@@ -205,5 +217,8 @@ if __name__ == "__main__":
     )
 
     ###### RUN THE MAIN LOOP ######
-    sv_ttk.set_theme("light")
+    # everything above was built into the withdrawn root; settle the whole layout in one geometry pass
+    # before the window is mapped, so it appears fully laid out instead of redrawing through intermediate states
+    root.update_idletasks()
+    root.deiconify()
     root.mainloop()
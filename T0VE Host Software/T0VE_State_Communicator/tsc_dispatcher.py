@@ -1,11 +1,11 @@
 from pubsub import pub
 import logging
 from typing import Any
-from datetime import datetime
-import copy
+import time
 
 from host_application_drivers.util_flat_dict import FlatDict
 from host_application_drivers.util_match_type_runtime import match_type
+from host_application_drivers.util_proto_dict import proto_to_dict
 from host_application_drivers.state_proto_defs import DebugLevel, NodeState
 
 ###################################################################################################
@@ -14,10 +14,10 @@ from host_application_drivers.state_proto_defs import DebugLevel, NodeState
 
 def DEFAULT_PORT_STATE() -> dict[str, Any]:
     '''
-    Return a deep copy of the default port state dictionary.
+    Return a freshly built default port state dictionary.
     Using this function prevents shared mutable references.
     '''
-    return copy.deepcopy({
+    return {
         "command": {
             "request_connect": True,
             "refresh_state": False,
@@ -29,7 +29,11 @@ def DEFAULT_PORT_STATE() -> dict[str, Any]:
             "commands_enqueued": 0,
             "command_queue_space": 0,
         }
-    })
+    }
+
+# the port state schema is static, so flatten it once at import
+# dotted topic suffixes, e.g. "command.request_connect", "status.connected"
+_PORT_STATE_TOPICS: tuple[str, ...] = tuple(".".join(path) for path in FlatDict.flatten(DEFAULT_PORT_STATE()).keys())
 
 def link_node_port_info(ui_port_topic_root: str, node_port_topic_root: str, logger: logging.Logger) -> None:
     '''
@@ -38,29 +42,26 @@ def link_node_port_info(ui_port_topic_root: str, node_port_topic_root: str, logg
     '''
     # on the serdes --> UI side, the topic tree looks just like our port state dictionary
     # serdes publishes directly under its topic root; ui receives publishes under {topic_root}.entries.set
-    # as such, we'll flatten our port state dict, and just forward publishes to our UI aggregator
-    flattened_port_state = FlatDict.flatten(DEFAULT_PORT_STATE())
-    port_state_topics = []
-    for path in flattened_port_state.keys():
-        port_state_topics.append(".".join([path_elem for path_elem in path]))
-    serdes_port_topics_in = [f"{node_port_topic_root}.{topic}" for topic in port_state_topics]
-    serdes_port_topics_out = [f"{node_port_topic_root}.{topic}" for topic in port_state_topics]
-    ui_port_topics_out = [f"{ui_port_topic_root}.entries.set.{topic}" for topic in port_state_topics]
-    ui_port_topics_in = [f"{ui_port_topic_root}.entries.get.{topic}" for topic in port_state_topics]
-    
-
-    #now subscribe to each of the serdes port topics, and forward the publishes to the corresponding UI port topics
-    for serdes_port_topic_in, ui_port_topic_out in zip(serdes_port_topics_in, ui_port_topics_out):
-        pub.subscribe(_forward_port_publish, serdes_port_topic_in, output_topic=ui_port_topic_out)
-        logger.debug(f"Subscribed to {serdes_port_topic_in}")
-
+    # as such, we'll use our pre-flattened port state topics, and just forward publishes to our UI aggregator
+    #
     # on the UI --> serdes side, we'll see publishes from the `.entries.get` topic, with topic-wise publishes
     # when the UI updates them. Subscribe to the request_connect and refresh_state entry topics, and forward to the serdes
     # I know this function listens to ALL entry topics, but only the command ones are editable, so it'll be the only publishes we see
     # serdes will ignore status topic publishes anyway
     # the code is just easier to write this way
-    for ui_port_topic_in, serdes_port_topic_out in zip(ui_port_topics_in, serdes_port_topics_out):
-        pub.subscribe(_forward_port_publish, ui_port_topic_in, output_topic=serdes_port_topic_out)
+    #
+    # both directions are wired in a single pass over the topics
+    for topic in _PORT_STATE_TOPICS:
+        serdes_port_topic = f"{node_port_topic_root}.{topic}"
+        ui_port_topic_in = f"{ui_port_topic_root}.entries.get.{topic}"
+        ui_port_topic_out = f"{ui_port_topic_root}.entries.set.{topic}"
+
+        #subscribe to the serdes port topic, and forward the publishes to the corresponding UI port topic
+        pub.subscribe(_forward_port_publish, serdes_port_topic, output_topic=ui_port_topic_out)
+        logger.debug(f"Subscribed to {serdes_port_topic}")
+
+        #and the reverse, UI entry updates back to the serdes
+        pub.subscribe(_forward_port_publish, ui_port_topic_in, output_topic=serdes_port_topic)
         logger.debug(f"Subscribed to {ui_port_topic_in}")
 
 
@@ -79,6 +80,24 @@ def _forward_port_publish(payload: Any = None, output_topic: str = None) -> None
 # NODE STATE
 ###################################################################################################
 
+# wire-format bytes of the last NodeState forwarded to each UI output topic
+# lets us skip the dict conversion + UI publish when the node reports the same state again
+_LAST_STATE_BYTES: dict[str, bytes] = {}
+
+# canonical repr of the last UI node state dict turned into a command, keyed the same way (UI output topic)
+# lets us skip re-deserializing + re-commanding the node when a UI publish carries nothing new
+_LAST_UI_STATE_REPR: dict[str, str] = {}
+
+def _declare_payload_topic(topic: str, payload_doc: str) -> None:
+    '''
+    Pin a topic's message data spec to a single required `payload` argument, documenting what it carries.
+    pubsub then rejects malformed sends at the publisher instead of every listener re-checking each message.
+    No-op if the topic already has a spec (e.g. someone subscribed or published first).
+    '''
+    topic_obj = pub.getDefaultTopicMgr().getOrCreateTopic(topic)
+    if not topic_obj.hasMDS():
+        topic_obj.setMsgArgSpec({"payload": payload_doc}, ("payload",))
+
 def link_node_state(ui_state_topic_root: str, node_state_topic_root: str, logger: logging.Logger) -> None:
     '''
     reformat/forward various serdes <--> UI publishes to each other
@@ -86,31 +105,46 @@ def link_node_state(ui_state_topic_root: str, node_state_topic_root: str, logger
     '''
     
     # on the serdes --> UI side, grab all the NodeState publishes to `status`
-    # turn them into a dictionary via betterproto inbuilts, the publish to the
+    # turn them into a dictionary (same layout as betterproto's to_dict), the publish to the
     # node state UI topic
-    pub.subscribe(_on_node_state_status, f"{node_state_topic_root}.status", ui_state_topic_root=ui_state_topic_root)
+    _declare_payload_topic(f"{node_state_topic_root}.status", "NodeState message received from the node")
+    pub.subscribe(_on_node_state_status, f"{node_state_topic_root}.status", out_topic=f"{ui_state_topic_root}.nested.set", logger=logger)
     logger.debug(f"Subscribed to {node_state_topic_root}.status")
 
     # on the UI --> serdes side, we'll see publishes from the `.nested.get` topic, 
     # complete dictionaries of the node state
     # turn these into betterproto NodeState messages and publish them to the `command` topic
-    pub.subscribe(_on_ui_node_state_entry_update, f"{ui_state_topic_root}.nested.get", node_state_topic_root=node_state_topic_root, logger=logger)
+    # status_out_topic lets UI edits invalidate the last-published cache, so the node's reply always reaches the UI
+    _declare_payload_topic(f"{ui_state_topic_root}.nested.get", "nested dict of the node state, as edited in the UI")
+    pub.subscribe(_on_ui_node_state_entry_update, f"{ui_state_topic_root}.nested.get", node_state_topic_root=node_state_topic_root, 
+                  status_out_topic=f"{ui_state_topic_root}.nested.set", logger=logger)
     logger.debug(f"Subscribed to {ui_state_topic_root}.nested.get")
 
-def _on_node_state_status(payload: Any = None, ui_state_topic_root: str = None) -> None:
-    #make sure we have a valid UI state topic root
-    if ui_state_topic_root is None:
+def _on_node_state_status(payload: Any = None, out_topic: str = None, logger: logging.Logger = None) -> None:
+    #make sure we have a valid UI state output topic
+    if out_topic is None:
         return
-    
-    #make sure our payload is a NodeState message
-    if not isinstance(payload, NodeState):
+
+    #payload is a NodeState message by topic convention (see `_declare_payload_topic`), no per-message type check
+    try:
+        #only forward if the state actually changed since our last publish
+        state_bytes = bytes(payload)
+        if _LAST_STATE_BYTES.get(out_topic) == state_bytes:
+            return
+        _LAST_STATE_BYTES[out_topic] = state_bytes
+
+        #the UI is about to show the node's state, so the last UI edit no longer reflects what's on screen
+        _LAST_UI_STATE_REPR.pop(out_topic, None)
+
+        #turn the payload into a dictionary; same layout as betterproto's `to_dict(include_default_values=True)`
+        node_state_dict = proto_to_dict(payload)
+    except Exception as e:
+        if logger is not None:
+            logger.error(f"_on_node_state_status: Error converting NodeState payload: {e}")
         return
-    
-    #turn the payload into a dictionary via betterproto inbuilts
-    node_state_dict = payload.to_dict(include_default_values=True)
-    pub.sendMessage(f"{ui_state_topic_root}.nested.set", payload=node_state_dict)
+    pub.sendMessage(out_topic, payload=node_state_dict)
 
-def _on_ui_node_state_entry_update(payload: Any = None, node_state_topic_root: str = None, logger: logging.Logger = None) -> None: 
+def _on_ui_node_state_entry_update(payload: Any = None, node_state_topic_root: str = None, status_out_topic: str = None, logger: logging.Logger = None) -> None: 
     #make sure we have a valid logger
     if logger is None:
         return
@@ -119,9 +153,16 @@ def _on_ui_node_state_entry_update(payload: Any = None, node_state_topic_root: s
     if node_state_topic_root is None:
         return
     
-    #make sure our payload is a dictionary of the node state
-    if not isinstance(payload, dict):
-        return
+    #payload is a dict of the node state by topic convention (see `_declare_payload_topic`), no per-message type check
+    #skip if this is exactly the state we last sent down to the node
+    if status_out_topic is not None:
+        state_repr = repr(payload)
+        if _LAST_UI_STATE_REPR.get(status_out_topic) == state_repr:
+            return
+        _LAST_UI_STATE_REPR[status_out_topic] = state_repr
+
+        #the UI now holds edited values; make sure the next status from the node gets forwarded even if unchanged
+        _LAST_STATE_BYTES.pop(status_out_topic, None)
 
     #turn the payload into a betterproto NodeState message
     try:
@@ -135,6 +176,12 @@ def _on_ui_node_state_entry_update(payload: Any = None, node_state_topic_root: s
 # NODE DEBUG 
 ###################################################################################################
 
+# debug level topic names, generated once from the protobuf debug message enum
+_DEBUG_LEVEL_NAMES: tuple[str, ...] = tuple(debug_level.name.upper() for debug_level in DebugLevel)
+
+# bracketed tag prepended to each debug message, one shared string per level
+_LEVEL_TAG: dict[str, str] = {debug_level: f"[{debug_level}]" for debug_level in _DEBUG_LEVEL_NAMES}
+
 def link_node_debug_termctrl(ui_debug_topic_root: str, port_status_topic_root: str, logger: logging.Logger) -> None:
     '''
     reformat/forward various serdes <--> UI publishes to each other
@@ -151,21 +198,20 @@ def link_node_debug_info(ui_debug_topic_root: str, node_debug_topic_root: str, l
     specifically regarding node debug information
     '''
 
-    #from the debug message enums from protobuf, generate the debug levels
-    debug_levels = [debug_level.name.upper() for debug_level in DebugLevel]
-
     #now subscribe to the debug topic root for each debug level
-    for debug_level in debug_levels:
-        pub.subscribe(_on_node_debug_info, f"{node_debug_topic_root}.{debug_level}", ui_debug_topic_root=ui_debug_topic_root, debug_level=debug_level)
+    #output topic and bracketed level tag are built once here rather than on every message
+    out_topic = f"{ui_debug_topic_root}.add"
+    for debug_level in _DEBUG_LEVEL_NAMES:
+        pub.subscribe(_on_node_debug_info, f"{node_debug_topic_root}.{debug_level}", out_topic=out_topic, debug_level_tag=_LEVEL_TAG[debug_level])
         logger.debug(f"Subscribed to {node_debug_topic_root}.{debug_level}")
 
-def _on_node_debug_info(payload: Any = None, ui_debug_topic_root: str = None, debug_level: str = None) -> None:
-    #make sure we have a valid UI debug topic root
-    if ui_debug_topic_root is None:
+def _on_node_debug_info(payload: Any = None, out_topic: str = None, debug_level_tag: str = None) -> None:
+    #make sure we have a valid UI debug output topic
+    if out_topic is None:
         return
 
-    #make sure we have a valid debug level
-    if debug_level is None:
+    #make sure we have a valid debug level tag
+    if debug_level_tag is None:
         return  
 
     #and string-coerce the payload
@@ -174,11 +220,23 @@ def _on_node_debug_info(payload: Any = None, ui_debug_topic_root: str = None, de
     except Exception as e:
         return
 
+    #initialize static variables that cache the formatted timestamp for the current wall-second
+    if not hasattr(_on_node_debug_info, '_last_sec'):
+        _on_node_debug_info._last_sec = None
+        _on_node_debug_info._last_str = ""
+
+    #only reformat the timestamp when the second rolls over; bursts of debug messages share it
+    ts = time.time()
+    int_sec = int(ts)
+    if int_sec != _on_node_debug_info._last_sec:
+        _on_node_debug_info._last_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts))
+        _on_node_debug_info._last_sec = int_sec
+
     #format the debug message
-    dbg_message = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: [{debug_level.upper()}] {payload_str}"
+    dbg_message = f"{_on_node_debug_info._last_str}: {debug_level_tag} {payload_str}"
 
     #forward the payload directly to the debug topic
-    pub.sendMessage(f"{ui_debug_topic_root}.add", payload=dbg_message)
+    pub.sendMessage(out_topic, payload=dbg_message)
 
 def _on_port_status_dis_connect(payload: Any = None, ui_debug_topic_root: str = None) -> None:   
     #make sure we have a valid UI debug topic root
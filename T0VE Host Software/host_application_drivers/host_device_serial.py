@@ -20,9 +20,10 @@ from __future__ import annotations              #as I understand, this helps wit
 
 import threading                                #concurrency
 import logging
-from typing import Optional                     #type hints
+from typing import List, Optional, Tuple, Union #type hints
 import re                                        #regex for serial number matching
-from queue import Queue, Empty, Full            #sharing information between threads
+from collections import deque                   #sharing information between threads (append/popleft are atomic)
+import struct                                   #packing/unpacking frame headers
 
 try:
     import serial   #pyserial; make sure the module is installed
@@ -30,46 +31,133 @@ try:
 except Exception:   #pragma: no cover - pyserial may not be installed at edit time
     raise ImportError("pyserial is not installed! Please install it with 'pip install pyserial'")
 
+#frame header helpers: 2-byte big-endian length, and full START_CODE + length header
+_LEN = struct.Struct(">H")
+_HEADER = struct.Struct(">BH")
+
+#raw byte `recover` feeds a stuck device; deliberately unframed, it's there to run out the device's partial frame
+_RECOVERY_BYTE = b"\x00"
+
+class _RxFramer:
+    '''
+    Splits the raw RX byte stream into frame payloads (START_CODE + 2-byte big-endian length + payload).
+    Self-contained on purpose: all state is the byte buffer, and `feed` is the only hot call.
+    Only touched from the RX thread.
+    '''
+    def __init__(self, start_code: int, logger: logging.Logger) -> None:
+        self._buf = bytearray()                                 #buffer for incoming bytes
+        self._start_byte = bytes([start_code & 0xFF])           #pre-built start marker for fast buffer searching
+        self._header_re = re.compile(re.escape(self._start_byte) + b"..", re.DOTALL)   #START_CODE + 2 length bytes
+        self._logger = logger
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buf)
+
+    def clear(self) -> None:
+        self._buf.clear()
+
+    def feed(self, data: bytes = b"") -> List[bytes]:
+        '''
+        Append `data` (if any) and return the payloads of all frames completed so far.
+        Noise before a start code is discarded; a trailing partial frame is kept for the next call.
+        '''
+        #alias for buffer for brevity
+        buf = self._buf
+        if data:
+            buf.extend(data)
+        frames: List[bytes] = []
+        pos = 0     #parse position; consumed bytes are trimmed from the buffer once at the end
+
+        while True:
+            # 1) Seek to the next START_CODE followed by a full length field, in one regex scan
+            m = self._header_re.search(buf, pos)
+            if m is None:
+                # no complete header; keep a trailing partial one (start code, <2 length bytes) for next time
+                start_idx = buf.find(self._start_byte, pos)
+                if start_idx >= 0:
+                    pos = start_idx
+                elif len(buf) > pos:
+                    # No start marker at all; purge the rest of the buffer
+                    self._logger.debug("RX buffer cleared (no start code): %d bytes", len(buf) - pos)
+                    pos = len(buf)
+                break   #but don't continue parsing in any case
+
+            # 2) Parse length (noise before the start marker is skipped over)
+            start_idx = m.start()
+            (length,) = _LEN.unpack_from(buf, start_idx + 1)
+            payload_start = start_idx + 3
+            payload_end = payload_start + length
+            if len(buf) < payload_end:
+                # Wait for more data
+                pos = start_idx
+                break
+
+            # 3) Extract payload
+            frames.append(bytes(buf[payload_start:payload_end]))
+            pos = payload_end
+            #per-frame log calls use lazy %-args: nothing gets formatted unless the level is enabled
+            self._logger.debug("Frame received: %d bytes", length)
+
+        # 4) Drop everything we consumed/discarded in one go
+        if pos > 0:
+            del buf[:pos]
+        return frames
 
- 
 class HostSerial:
+    TX_QUEUE_MAX: int = 8           #max frames waiting for the TX thread
+    MAX_RX_DRAIN_ITERS: int = 8     #max extra port reads coalesced per RX loop iteration
+    TX_IDLE_WAIT_S: float = 0.5     #TX thread safety-net wakeup; shutdown/port errors wake it directly via `_tx_ready`
+    DISCONNECTED_POLL_S: float = 0.5        #port thread poll interval while disconnected (and right after the port list changes)
+    DISCONNECTED_POLL_MAX_S: float = 2.0    #longest interval the disconnected poll backs off to while the port list stays the same
+
     def __init__(
         self,
         *,
-        device_serial_regex: Optional[str] = None,
+        device_serial_regex: Optional[Union[str, re.Pattern[str]]] = None,
         start_code: int = 0xEE,
         serial_buffer_size: int = 32768,
         logger: Optional[logging.Logger] = None,
     ) -> None:
 
         ######### PORT-RELATED #########
-        self._allowing_connections: bool = True                  #might *technically* need an atomic guard, but only one thread reads, other writes
-        self._serial_regex_str: Optional[str] = device_serial_regex
+        self._allowing_connections = threading.Event()           #user-requested connection state (set: connect), written by the API, read by the port thread
+        self._allowing_connections.set()
+        #accepts the pattern string, or an already compiled pattern (used as-is)
         self._serial_regex: Optional[re.Pattern[str]] = (
             re.compile(device_serial_regex) if device_serial_regex else None
         )
+        self._serial_regex_str: Optional[str] = self._serial_regex.pattern if self._serial_regex else None
         self._port: Optional[serial.Serial] = None
-        self._port_connected: bool = False                      #might *technically* need an atomic guard, but only one thread reads, other writes
+        self._port_connected = threading.Event()                 #set while the port is open; written by the port thread, read everywhere
         self._connected_port_name: Optional[str] = None          #e.g. COM3
         self._connected_serial_number: Optional[str] = None      #matched device serial
-        self._start_code: int = start_code
+        self._start_code: int = start_code & 0xFF                #masked once here; `write_frame` packs it straight into every header
         self._serial_buffer_size: int = serial_buffer_size       #OS-level serial buffer size (Windows)
         self._logger = logger or logging.getLogger(__name__ + ".HostSerial")
         self._port_error_do_shutdown_signal = threading.Event()
+        self._port_wake = threading.Event()                     #wakes the port thread early (port errors, connect/disconnect requests, shutdown)
+        self._flow_control_applied: Optional[Tuple[serial.Serial, bool]] = None  #(port, state) the DTR/RTS lines were last set for
+        self._last_port_names: Optional[frozenset[str]] = None  #devices seen by the last port enumeration (`_handle_connect`)
+        self._port_list_changed: bool = True                    #whether that enumeration differed from the one before
 
         ######### TX-RELATED #########
-        self._tx_queue: Queue[bytes] = Queue(maxsize=8)      #queue for outgoing bytes
+        self._tx_queue: deque[bytes] = deque()          #queue for outgoing bytes (bounded in `write_frame`)
+        self._tx_ready = threading.Event()              #set whenever something is appended to the TX queue
 
         ######### RX-RELATED #########
-        self._rx_buffer = bytearray()                   #buffer for incoming bytes
+        self._framer = _RxFramer(start_code, self._logger)  #buffers incoming bytes, splits them into frames
+        self._min_read_chunk: int = 3                   #smallest read worth issuing on an empty buffer (1 start + 2 length)
         self._rx_clear_signal = threading.Event()       #signal to clear the rx buffer (buffer clearing handled in the receive thread)
-        self._rx_queue: Queue[bytes] = Queue()   #queue for completed RX frames
+        self._rx_queue: deque[bytes] = deque()          #queue for completed RX frames
+        self._rx_ready = threading.Event()              #set whenever a frame is appended to the RX queue
+        self._rx_frame_event = threading.Event()        #also set on every frame; owned by `recover` (not cleared by readers)
 
         ######### SPAWN THREAD ########
         self._stop_signal = threading.Event()
-        self._tx_thread = threading.Thread(target=self._run_tx, name=f"host_serial_tx_{device_serial_regex or ''}", daemon=True)
-        self._rx_thread = threading.Thread(target=self._run_rx, name=f"host_serial_rx_{device_serial_regex or ''}", daemon=True)
-        self._port_thread = threading.Thread(target=self._run_port, name=f"host_serial_port_{device_serial_regex or ''}", daemon=True)
+        self._tx_thread = threading.Thread(target=self._run_tx, name=f"host_serial_tx_{self._serial_regex_str or ''}", daemon=True)
+        self._rx_thread = threading.Thread(target=self._run_rx, name=f"host_serial_rx_{self._serial_regex_str or ''}", daemon=True)
+        self._port_thread = threading.Thread(target=self._run_port, name=f"host_serial_port_{self._serial_regex_str or ''}", daemon=True)
         # self._tx_thread.start()   #start the TX thread in `handle_connect`
         # self._rx_thread.start()   #start the RX thread in `handle_connect`
         self._port_thread.start()
@@ -82,6 +170,9 @@ class HostSerial:
         """
         try:
             self._stop_signal.set()
+            self._port_wake.set()   #wake the port thread so it exits without waiting out its poll interval
+            self._rx_ready.set()    #wake anyone blocked in `read_frame(wait=True)` so they can notice the shutdown
+            self._tx_ready.set()    #and the TX thread, so it exits without waiting out its idle timeout
         except Exception:
             return  #If construction failed part-way, `_stop_signal` may not exist.
 
@@ -112,23 +203,25 @@ class HostSerial:
         '''
         Connect the port
         '''
-        if(self._allowing_connections):
+        if(self._allowing_connections.is_set()):
             return
-        self._allowing_connections = True
+        self._allowing_connections.set()
+        self._port_wake.set()
         self._logger.info("connect() requested")
 
     def disconnect(self) -> None:
         '''
         Disconnect the port
         '''
-        if(not self._allowing_connections):
+        if(not self._allowing_connections.is_set()):
             return
-        self._allowing_connections = False
+        self._allowing_connections.clear()
+        self._port_wake.set()
         self._logger.info("disconnect() requested")
     
     @property
     def port_connected(self) -> bool:
-        return self._port_connected
+        return self._port_connected.is_set()
 
     @property
     def port_name(self) -> Optional[str]:
@@ -149,35 +242,45 @@ class HostSerial:
         The TX framing is: START_CODE (1 byte) + length (2 bytes, big-endian)
         + payload bytes. Thread-safe and non-blocking.
         """
-        #explicitly convert our payload to bytes, extract length of the data
-        data = bytes(payload)
+        #convert our payload to bytes (no copy if it already is), extract length of the data
+        data = payload if type(payload) is bytes else bytes(payload)
         length = len(data)
 
         #sanity check our length
         if length > 0xFFFF:
             raise ValueError("payload too large for 16-bit length field")
 
-        #build our header, see framing note above
-        header = bytes(((self._start_code & 0xFF), (length >> 8) & 0xFF, length & 0xFF))
-        
-        #assemble our frame and enqueue
-        frame = header + data
-        try:
-            self._tx_queue.put_nowait(frame)
-        except Full:
-            self._logger.warning(f"TX queue full (max 4); dropping frame ({length} bytes)")
+        #bail before building anything if the frame would just be dropped
+        if len(self._tx_queue) >= self.TX_QUEUE_MAX:
+            self._logger.warning("TX queue full (max %d); dropping frame (%d bytes)", self.TX_QUEUE_MAX, length)
+            return
+
+        #assemble our frame (header, see framing note above, + payload) and enqueue
+        frame = _HEADER.pack(self._start_code, length) + data
+        self._tx_queue.append(frame)
+        self._tx_ready.set()
 
     #### RX ####
     def read_frame(self, wait: bool = False, timeout: float = 0.1) -> Optional[bytes]:
         '''
         Read a frame from the RX queue. If no frame is available, return None.
         '''
-        try:    
-            if wait:
-                return self._rx_queue.get(timeout=timeout)
-            else:
-                return self._rx_queue.get_nowait()
-        except Empty:
+        try:
+            return self._rx_queue.popleft()
+        except IndexError:
+            if not wait:
+                return None
+
+        #clear the ready flag *then* re-check, so a frame landing in between isn't missed
+        self._rx_ready.clear()
+        try:
+            return self._rx_queue.popleft()
+        except IndexError:
+            pass
+        self._rx_ready.wait(timeout)
+        try:
+            return self._rx_queue.popleft()
+        except IndexError:
             return None
     
     def clear_receive_buffer(self) -> None:
@@ -193,53 +296,93 @@ class HostSerial:
         *,
         attempts: int = 65536,
         inter_delay_s: float = 0.02,
-    ) -> None:
+    ) -> bool:
         '''
         Recover from a disconnect by sending 0's to the port until a message has been received.
+        Returns True as soon as a frame arrives, rather than at the end of the current inter-byte delay;
+        False if the attempts ran out, or the port disconnected/shut down first.
         '''
+        #hoist loop-invariant attributes/conversions to locals
+        rx_queue = self._rx_queue
+        rx_frame = self._rx_frame_event
+        stop = self._stop_signal
+        tx_queue = self._tx_queue
+        tx_ready = self._tx_ready
+        tx_queue_max = self.TX_QUEUE_MAX
+        delay_s = float(inter_delay_s)
+
+        #only frames arriving from here on count
+        rx_frame.clear()
         for _ in range(int(attempts)):
             #check to see if we've received a complete frame
             #if we've received a frame from the device, means we've recovered
-            if(not self._rx_queue.empty()):
-                return
+            if(rx_queue or rx_frame.is_set()):
+                return True
 
-            #also check to see if we've disconnnected
+            #also check to see if we've disconnnected or are shutting down
             #in which case, recovery is irrelevant
-            if not self._port_connected:
-                return
+            if not self._port_connected.is_set() or stop.is_set():
+                return False
 
             #otherwise, drop a 0 directly into the tx queue
             #and wait a little for the thread to process it
-            try:
-                self._tx_queue.put_nowait(b"\x00")
-            except Full:
-                self._logger.warning(f"TX queue full (max {self._tx_queue.maxsize}) during recover(); dropping byte 0x00")
-            self._stop_signal.wait(float(inter_delay_s))
+            if len(tx_queue) >= tx_queue_max:
+                self._logger.warning(f"TX queue full (max {tx_queue_max}) during recover(); dropping byte 0x00")
+            else:
+                tx_queue.append(_RECOVERY_BYTE)
+                tx_ready.set()
+            rx_frame.wait(delay_s)
+        return False
 
     #=================== THREAD FUNCTIONS =================
     #------------------- THREAD 1: TX -------------------
     def _run_tx(self) -> None:
         '''
         This thread function drains the TX queue and writes to the port.
-        Uses blocking get with timeout to avoid spinning.
+        Uses blocking get with timeout to avoid spinning; frames queued together are coalesced into one write.
         '''
+        #hoist loop-invariant attributes to locals (port is fixed for the life of this thread)
+        stop = self._stop_signal
+        port_error = self._port_error_do_shutdown_signal
+        port_wake = self._port_wake
+        tx_ready = self._tx_ready
+        tx_queue = self._tx_queue
+        port = self._port
+        log = self._logger
+        idle_wait_s = self.TX_IDLE_WAIT_S
+
         #kill the transmit thread with the stop signal or the port error signal
         #in the case of a port error, thread will be restarted when we successfully reconnect
-        while not self._stop_signal.is_set() and not self._port_error_do_shutdown_signal.is_set():
-            # Block waiting for TX data (with timeout to check stop signal)
-            try:
-                to_transmit = self._tx_queue.get(timeout=0.1)
-            except Empty:
+        while not stop.is_set() and not port_error.is_set():
+            # Block waiting for TX data; stop/port errors also set `tx_ready`, the timeout is only a safety net
+            if not tx_ready.wait(timeout=idle_wait_s):
                 continue  # Timeout - loop back to check stop signal
+            tx_ready.clear()  #clear before draining; anything appended after this re-sets it
 
-            # Write to port
+            # Drain everything queued so it all goes out in a single write
+            # the usual case is a single frame: hand that straight to the port, no batch buffer or copy
+            try:
+                to_transmit = tx_queue.popleft()
+            except IndexError:
+                continue
+            if tx_queue:
+                frames = [to_transmit]
+                while True:
+                    try:
+                        frames.append(tx_queue.popleft())
+                    except IndexError:
+                        break
+                to_transmit = b"".join(frames)
+
+            # Write to port (one write per batch, rather than per frame)
+            # no flush: that waits for the OS to finish physically sending; the frames are self-delimiting so we don't need to
             try:
-                self._logger.debug(f"TX {len(to_transmit)} bytes")
-                self._port.write(to_transmit)
-                self._port.flush()
+                log.debug("TX %d bytes", len(to_transmit))
+                port.write(to_transmit)
             except Exception as exc:    #catch all excepitons, and consider them port issues
-                self._logger.warning(f"Serial exception during TX: {exc}")
-                self._port_error_do_shutdown_signal.set()  # Signal port thread to handle
+                log.warning(f"Serial exception during TX: {exc}")
+                port_error.set()  # Signal port thread to handle
+                port_wake.set()
 
     #------------------- THREAD 2: RX -------------------
     def _run_rx(self) -> None:
@@ -247,39 +390,67 @@ class HostSerial:
         This thread function reads from the port and enqueues any new frames into the RX queue.
         Uses blocking reads with timeout for efficiency.
         '''
-        while not self._stop_signal.is_set() and not self._port_error_do_shutdown_signal.is_set():
+        #hoist loop-invariant attributes to locals (port is fixed for the life of this thread)
+        stop = self._stop_signal
+        port_error = self._port_error_do_shutdown_signal
+        port_wake = self._port_wake
+        rx_clear = self._rx_clear_signal
+        framer = self._framer
+        port = self._port
+        log = self._logger
+        min_read_chunk = self._min_read_chunk
+        max_drain_iters = self.MAX_RX_DRAIN_ITERS
+
+        while not stop.is_set() and not port_error.is_set():
             # Read from port + handle RX buffer flush - use blocking read for efficiency
             try:
                 # Check if we need to clear the RX buffer
-                if self._rx_clear_signal.is_set():
+                if rx_clear.is_set():
                     self._flush_rx_buffer()
-                    self._rx_clear_signal.clear()
+                    rx_clear.clear()
 
                 # Check for pending data first
-                pending = self._port.in_waiting
-                if pending > 0:
+                # with an empty RX buffer nothing can be parsed until a full header is in, so don't bother reading less
+                min_chunk = 1 if framer.buffered else min_read_chunk
+                pending = port.in_waiting
+                if pending >= min_chunk:
                     # Data available - read it all
-                    data = self._port.read(pending)
+                    # that's everything the OS had a moment ago, so don't poll `in_waiting` again right away;
+                    # anything arriving meanwhile is picked up by the next iteration's check
+                    data = port.read(pending)
+                    blocked = False
                 else:
-                    # No data - do short blocking read (port timeout handles this)
+                    # Not enough data - do short blocking read for the rest (port timeout handles this)
                     # Note: port.timeout should be set to a small value (e.g., 0.01-0.1s)
-                    data = self._port.read(1)
-                    # If we got a byte, grab any additional pending data
-                    if data:
-                        more = self._port.in_waiting
-                        if more > 0:
-                            data += self._port.read(more)
+                    # (no single large read here: pyserial blocks until the full count arrives or the timeout hits)
+                    data = port.read(min_chunk)
+                    blocked = True
+
+                # If we waited and got something, grab the rest of the burst that arrived meanwhile so it's parsed in one pass
+                # bounded, so a device streaming nonstop can't keep us from servicing the clear/stop signals
+                # chunks are joined once at the end rather than re-copying the growing burst on every read
+                if data and blocked:
+                    chunks = None
+                    for _ in range(max_drain_iters):
+                        more = port.in_waiting
+                        if more <= 0:
+                            break
+                        if chunks is None:
+                            chunks = [data]
+                        chunks.append(port.read(more))
+                    if chunks is not None:
+                        data = b"".join(chunks)
 
             except Exception as exc:    #consider all exceptions as issues with the port
-                self._logger.warning(f"Serial exception during RX: {exc}")
-                self._port_error_do_shutdown_signal.set()
+                log.warning(f"Serial exception during RX: {exc}")
+                port_error.set()
+                port_wake.set()
                 continue
 
             # Process received data (if any)
             if data:
-                self._rx_buffer.extend(data)
-                self._logger.debug(f"RX {len(data)} bytes")
-                self._process_rx_buffer()
+                log.debug("RX %d bytes", len(data))
+                self._process_rx_buffer(data)
 
     #------------------- THREAD 3: PORT -------------------
     def _run_port(self) -> None:
@@ -289,41 +460,64 @@ class HostSerial:
          - manages flow control lines of the port
          - handles errors accessing the port
         '''
+        #hoist loop-invariant attributes to locals
+        #(`_port_connected` changes under us, so it's still checked each time)
+        stop = self._stop_signal
+        port_wake = self._port_wake
+        log = self._logger
+        disconnected_poll_min_s = self.DISCONNECTED_POLL_S
+        disconnected_poll_max_s = self.DISCONNECTED_POLL_MAX_S
+
+        #current disconnected poll interval (backs off while connect attempts find the same ports)
+        disconnected_poll_s = disconnected_poll_min_s
+
         #loop until we're told to stop
-        while(not self._stop_signal.is_set()):
+        while(not stop.is_set()):
             #check to see if we need to connect/disconnect the port
+            #(a pass that doesn't enumerate ports counts as "changed", so only repeated fruitless enumerations back off)
+            self._port_list_changed = True
             self._check_do_dis_connect()
 
             #manage flow control lines of the port
             try:
                 self._manage_flow_control()
             except Exception as exc:
-                self._logger.warning(f"Serial exception during Flow Control: {exc}")
+                log.warning(f"Serial exception during Flow Control: {exc}")
                 self._port_error_do_shutdown_signal.set()
                 continue #immediately shut donw the port on error
 
             #sleep for a bit to avoid busy-waiting
-            #shorter when connected (to catch errors quickly), longer when disconnected
-            sleep_time = 0.1 if self._port_connected else 0.5
-            self._stop_signal.wait(sleep_time)
+            #port errors, connect/disconnect requests and shutdown wake us early (`_port_wake`), so the interval
+            #only bounds how often we re-check on our own: shorter when connected, longer when disconnected
+            #while disconnected, port enumeration is slow (especially on Windows), so keep doubling the interval
+            #as long as the available ports stay the same; any device arriving/leaving starts over at the minimum
+            if not self._port_connected.is_set():
+                if self._port_list_changed:
+                    disconnected_poll_s = disconnected_poll_min_s
+                else:
+                    disconnected_poll_s = min(disconnected_poll_s * 2, disconnected_poll_max_s)
+                sleep_time = disconnected_poll_s
+            else:
+                disconnected_poll_s = disconnected_poll_min_s
+                sleep_time = 0.1
+            #clear after waking, so anything signalled while we handle it re-wakes the next wait
+            port_wake.wait(sleep_time)
+            port_wake.clear()
 
     #============================== HELPER FUNCTIONS =============================
     #------------------- TX Helpers -------------------
     def _flush_tx_buffer(self) -> None:
         #just drain the transmit queue until it's empty
-        while(True):
-            try:
-                self._tx_queue.get_nowait();
-            except Empty:
-                return
+        self._tx_queue.clear()
+        self._tx_ready.clear()
 
     #------------------- RX Helpers -------------------
     def _flush_rx_buffer(self) -> None:
         '''
         Flush the RX buffer
         '''
-        self._logger.debug(f"Clearing RX buffer ({len(self._rx_buffer)} bytes)")
-        self._rx_buffer.clear()
+        self._logger.debug(f"Clearing RX buffer ({self._framer.buffered} bytes)")
+        self._framer.clear()
         
         try: #attempt to reset the port's receive buffer
             self._port.reset_input_buffer()
@@ -332,48 +526,14 @@ class HostSerial:
             self._logger.warning(f"Serial exception during Buffer Clear: {exc}")
             raise exc
 
-    def _process_rx_buffer(self) -> None:
+    def _process_rx_buffer(self, data: bytes = b"") -> None:
         '''
-        Process any new frames we have in our RX buffer
+        Add new data to our RX buffer, and process any new frames we have in it
         '''
-        while True:
-            #alias for buffer for brevity
-            buf = self._rx_buffer
-            
-            # 1a) Seek to the next START_CODE
-            start_idx = None
-            for i, b in enumerate(buf):
-                if b == (self._start_code & 0xFF):
-                    start_idx = i
-                    break
-
-            if start_idx is None:
-                if(len(buf) > 0):
-                    # No start marker at all; purge the buffer and break
-                    self._logger.debug(f"RX buffer cleared (no start code): {len(buf)} bytes")
-                    buf.clear() 
-                break   #but don't continue parsing in any case
-
-            # 1b) Discard noise before the start marker
-            if start_idx > 0:
-                del buf[:start_idx]
-
-            # 2a) Need at least 3 bytes (1 start + 2 length)
-            if len(buf) < 3:
-                break
-
-            # 2b) Parse length
-            length = (buf[1] << 8) | buf[2]
-            total_needed = 1 + 2 + length
-            if len(buf) < total_needed:
-                # Wait for more data
-                break
-
-            # 3) Extract payload, remove from buffer, and push to receive frame queue
-            payload = bytes(buf[3:3 + length])
-            del buf[:total_needed]
-            self._rx_queue.put(payload)
-            self._logger.debug(f"Frame received: {length} bytes")
+        for payload in self._framer.feed(data):
+            self._rx_queue.append(payload)
+            self._rx_ready.set()
+            self._rx_frame_event.set()
 
     #------------------- PORT Helpers -------------------
     def _check_do_dis_connect(self) -> None:
@@ -383,12 +543,13 @@ class HostSerial:
         #if we are connected currently and we want to don't want to connect
         #or if there was some error with a serial port operation --> disconnect
         if(
-            (self._port_connected and not self._allowing_connections)
+            (self._port_connected.is_set() and not self._allowing_connections.is_set())
             or self._port_error_do_shutdown_signal.is_set()
         ):
             #start by shutting down the TX and RX threads using the shutdown signal
             try:
                 self._port_error_do_shutdown_signal.set()
+                self._tx_ready.set()    #wake the TX thread so it sees the shutdown signal right away
                 self._tx_thread.join(timeout=1)
                 self._rx_thread.join(timeout=1)
             except Exception:
@@ -403,12 +564,12 @@ class HostSerial:
         #if we aren't connected currently and we want to connect
         #and if we have a proper node target (serial regex)
         elif(
-            not self._port_connected
-            and self._allowing_connections
+            not self._port_connected.is_set()
+            and self._allowing_connections.is_set()
             and self._serial_regex is not None
         ):
             self._handle_connect()
-            if(self._port_connected):   #if we were able to successfully connect to the serial port, start tx/rx threads
+            if(self._port_connected.is_set()):   #if we were able to successfully connect to the serial port, start tx/rx threads
                 self._flush_rx_buffer() #flush any stale RX data
                 self._flush_tx_buffer() #flush any stale inbound tx packets
                 self._tx_thread.start() #start TX thread
@@ -430,6 +591,12 @@ class HostSerial:
             candidate = None
             candidate_sn = None
             ports = list(list_ports.comports())
+
+            #note whether the set of devices changed since the last enumeration (drives the port thread's backoff)
+            port_names = frozenset(p.device for p in ports)
+            self._port_list_changed = port_names != self._last_port_names
+            self._last_port_names = port_names
+
             for p in ports:
                 sn = getattr(p, 'serial_number', None)
                 if sn is None:
@@ -465,7 +632,7 @@ class HostSerial:
             
             self._connected_port_name = str(candidate.device)
             self._connected_serial_number = candidate_sn
-            self._port_connected = True
+            self._port_connected.set()
             self._logger.info(
                 f"Port opened: {self._connected_port_name} (serial {self._connected_serial_number})"
             )
@@ -488,8 +655,9 @@ class HostSerial:
         except serial.SerialException as exc:
             self._logger.warning(f"Serial exception during port close: {exc}")
             self._logger.debug("Ignoring exception during port close")
-        self._port_connected = False
+        self._port_connected.clear()
         self._port = None
+        self._flow_control_applied = None
         self._connected_port_name = None
         self._connected_serial_number = None
         self._logger.info("Port disconnected")
@@ -502,15 +670,21 @@ class HostSerial:
         port = self._port
         if port is None:
             return
-            
+
+        # Only touch the lines when the port or connection state changed (each write is an ioctl)
+        connected = self._port_connected.is_set()
+        if self._flow_control_applied == (port, connected):
+            return
+
         # Set DTR/RTS based on connection state
         try:
-            if self._port_connected:
+            if connected:
                 port.dtr = True
                 port.rts = True
             else:
                 port.dtr = False
                 port.rts = False
+            self._flow_control_applied = (port, connected)
         except Exception as exc:
             # Port may have been closed/disconnected, raise to caller
             raise exc
@@ -10,16 +10,17 @@ NOTE: there's a bit of publishing mentioned in this description. I specifically
       to if the value of that topic changes! This minimizes broker traffic and should hopefully improve the performance of the system. 
 
 It will also instantiate a thread. The function of this thread is (transmit thread):
-    - waits on the refresh_state_signal, falls through after the default gentle poll rate
+    - ticks at the max polling rate; every tick:
+        - report the port status and the command queue space
+        - if refresh_state has been signaled, OR the command queue has something in it
+            - assert the refresh_state_signal
+    - transmits when refresh_state_signal is asserted (rate limited to the max polling rate), or after the default gentle poll rate
     - if(connected to the serial port)
-        - pulls from the command queue, if command queue is none, create an empty command (so we can pull status from the node)
-        - serializes this command using `better_proto`
-        - resets a `received_frame` flag 
-        - writes this serialized command to the serial port
-        - waits (with timeout) until `received_frame` is set
-        - if we time out
-            - check if we're still connected
-            - if still connected, call the port's recover function
+        - pulls from the command queue, if command queue is none, use an empty command (so we can pull status from the node)
+        - serializes this command using `better_proto` (the empty command is serialized once up front and reused)
+        - writes this serialized command to the serial port, and moves straight on (no per-write wait for the reply)
+    - watchdog, every tick while connected: if no state message has arrived for the receive timeout
+        - call the port's recover function
     - otherwise
         - flush the command queue
         - sleep for the default gentle poll rate
@@ -32,19 +33,16 @@ It also instantiates a second thread. This thread is (receive thread):
         - publish on the 'debug' topic (see below)
     - if state message
         - directly publish the protobuf NodeState message to the 'state' topic (see below)
+        - note the arrival time for the transmit thread's watchdog
 
-And the third thread is (trigger/connect thread):
- - checks if we want to connect/disconnect the serial port
- - if refresh_state has been signaled, OR the command queue has something in it
-    - assert the refresh_state_signal
- - report the port status and the command queue space
+(connecting/disconnecting the serial port is handled directly in the `request_connect` callback)
 
-Fourth thread is (file request thread):
+Third thread is (file request thread):
  - wait until the file request queue has something in it
  - pops a file request from the file request queue
  - serializes the file request using betterproto
  - writes the serialized file request to the serial port
- - waits (with timeout) until `received_file` is set
+ - waits (with timeout) for the response, handed over by the receive thread through a queue
  - recover if we time out
  - handle file responses via the receive thread
 
@@ -81,33 +79,59 @@ Let's talk about message organization
 '''
 
 from __future__ import annotations
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 import threading
+import time
 import logging
+import re
 from pubsub import pub
+from pubsub.core import Topic
 import copy
 
-from queue import Queue, Empty  #for command message queue
-import betterproto
+from queue import Queue, SimpleQueue, Empty  #for command message queue (+ file response handoff)
+
+#betterproto swaps Message bytes()/parse() for the Rust codec when it's installed (~10x faster encode/decode)
+#nothing to call here, just note which one we're running with; falls back to pure-Python betterproto
+try:
+    import betterproto_rust_codec  # noqa: F401
+    _PROTO_CODEC = "rust"
+except ImportError:
+    _PROTO_CODEC = "python"
 
 from host_application_drivers.host_device_serial import HostSerial                                          # lower layer serial driver
-from host_application_drivers.state_proto_defs import Communication, NodeState, Debug, NeuralMemFileRequest # protobuf message definitions
+from host_application_drivers.state_proto_defs import Communication, NodeState, Debug, DebugLevel, NeuralMemFileRequest # protobuf message definitions
 from host_application_drivers.state_proto_node_default import NodeStateDefaults                             # protobuf message defaults
 
+_UNSET = object()   #sentinel: topic never published
+
+# device serial-number pattern per node index, compiled once for every serdes instance
+# NOTE: serial-number regex is case-sensitive; adjust upstream if device serials may differ in case.
+_SERIAL_REGEX: Dict[str, re.Pattern] = {
+    "0": re.compile(r'^[0-9A-F]{24}_NODE_00$'),
+    "1": re.compile(r'^[0-9A-F]{24}_NODE_01$'),
+    "2": re.compile(r'^[0-9A-F]{24}_NODE_02$'),
+    "3": re.compile(r'^[0-9A-F]{24}_NODE_03$'),
+    "4": re.compile(r'^[0-9A-F]{24}_NODE_04$'),
+    "15": re.compile(r'^[0-9A-F]{24}_NODE_15$'),
+    "Any": re.compile(r'^[0-9A-F]{24}_NODE_(?:[0-9]{2})$'), #matches any node 00-99
+}
+
 class HostDeviceStateSerdes:
     """
     Serialize/deserialize BetterProto `Communication` messages for a specific node and
     expose mirrored state via PyPubSub. Current design uses three threads:
 
-    - Transmit: waits on `refresh_state_signal` or `default_poll_s`, sends local `NodeState`,
-      and awaits an RX state message (else invokes `recover()` on timeout if still connected).
+    - Transmit: ticks at `max_poll_s`, publishing `...port.status.{connected,port_name,serial_number,...}` and
+      triggering `refresh_state_signal` when `...port.command.refresh_state` is true or commands are queued.
+      On `refresh_state_signal` or every `default_poll_s`, sends local `NodeState` without waiting for the reply.
+      Invokes `recover()` if connected but no RX state message has arrived for `rx_timeout_s`.
     - Receive: parses inbound frames; publishes `node_state` to `...state` and `debug_message` to `...debug`.
-      Only `node_state` messages acknowledge TX.
-    - Trigger/connect: reflects `...port.command.request_connect`, triggers `refresh_state_signal` when
-      `...port.command.refresh_state` is true, and publishes `...port.status.{connected,port_name,serial_number}`.
+      Only `node_state` messages count as replies for the watchdog.
+    - File request: sends queued file requests and awaits their responses.
+    `...port.command.request_connect` is reflected onto the port directly in its callback.
 
     Notes:
-    - Values publish only when changed.
+    - Values publish only when changed; repeated identical state frames from the node are not re-published.
     - TX intentionally polls at `default_poll_s` in absence of commands.
     - Auto-connect uses a case-sensitive serial-number regex; ensure device serials match formatting.
     """
@@ -122,27 +146,35 @@ class HostDeviceStateSerdes:
     ) -> None:
 
         #sanity check the node index, raise value error if not sane
-        if(node_index not in ["0", "1", "2", "3", "4", "15", "Any"]):
+        if(node_index not in _SERIAL_REGEX):
             raise ValueError("Invalid Node index!")
 
         # identity / hierarchy
         self.node = "node_" + node_index.zfill(2)  #ensure two digits for node label
         self.root = f"app.devices.{self.node}"  # PyPubSub uses '.' separator by default
 
+        # topic strings we publish on, built once rather than per publish
+        self._topic_status = f"{self.root}.status"
+        self._topic_file_response = f"{self.root}.file_response"
+        self._topic_refresh_state = f"{self.root}.port.command.refresh_state"
+        self._topic_port_connected = f"{self.root}.port.status.connected"
+        self._topic_port_name = f"{self.root}.port.status.port_name"
+        self._topic_port_serial_number = f"{self.root}.port.status.serial_number"
+        self._topic_port_commands_enqueued = f"{self.root}.port.status.commands_enqueued"
+        self._topic_port_command_queue_space = f"{self.root}.port.status.command_queue_space"
+        self._topics_debug = {debug_level: f"{self.root}.debug.{debug_level.name}" for debug_level in DebugLevel}
+
+        # last value published per topic, for change-only publishing (see module notes)
+        self._last_pub: Dict[str, Any] = {}
+
+        # resolved pubsub Topic objects per topic string (see `_send`)
+        self._topic_objs: Dict[str, Topic] = {}
+
         self.log = logger or logging.getLogger(f"{__name__}.{self.node}.serdes")
+        self.log.debug(f"protobuf codec: {_PROTO_CODEC}")
 
-        # lower layer port
-        # NOTE: serial-number regex is case-sensitive; adjust upstream if device serials may differ in case.
-        regex_map = {
-            "0": r'^[0-9A-F]{24}_NODE_00$',
-            "1": r'^[0-9A-F]{24}_NODE_01$',
-            "2": r'^[0-9A-F]{24}_NODE_02$',
-            "3": r'^[0-9A-F]{24}_NODE_03$',
-            "4": r'^[0-9A-F]{24}_NODE_04$',
-            "15": r'^[0-9A-F]{24}_NODE_15$',
-            "Any": r'^[0-9A-F]{24}_NODE_(?:[0-9]{2})$', #matches any node 00-99
-        }
-        self.port = HostSerial(device_serial_regex=regex_map[node_index], logger=self.log)
+        # lower layer port, matched by the node's (precompiled) serial-number regex
+        self.port = HostSerial(device_serial_regex=_SERIAL_REGEX[node_index], logger=self.log)
 
         # timings
         self.default_poll_s = float(default_poll_s)
@@ -152,17 +184,32 @@ class HostDeviceStateSerdes:
         # command message queue
         self._command_queue: Queue[NodeState] = Queue(maxsize=16)          #queue for outbound commands
 
+        # persistent TX encoding state (only touched by the transmit thread)
+        # the empty poll command never changes, so build + serialize it once rather than every idle poll
+        self._tx_comm = Communication()
+        self._empty_command_bytes: bytes = bytes(Communication(node_state=NodeStateDefaults.default_command_empty()))
+
+        # raw bytes of the last node state frame we published; identical frames skip decode + publish
+        # cleared whenever we send a real command, so the node's reply to it always goes out
+        self._last_state_frame: Optional[bytes] = None
+
         # file request message queue
         self._file_request_queue: Queue[NeuralMemFileRequest] = Queue(maxsize=16)   #queue for outbound file requests
 
+        # file responses handed from the receive thread to the file request thread
+        # a queue rather than a set/clear flag: a late response to a timed-out request is drained before the next
+        # request goes out, instead of racing the clear() and acknowledging the wrong request
+        self._file_response_queue: SimpleQueue[NeuralMemFileRequest] = SimpleQueue()
+
         #============== THREADING ==============
         # request/response coordination
         self.refresh_state_signal = threading.Event()
         self.refresh_state_signal_external = threading.Event()
-        self.rx_frame_received_signal = threading.Event()
-        self.rx_file_response_signal = threading.Event()  # separate signal for file responses
         self.stop = threading.Event()
 
+        # monotonic time of the last node state message received; the transmit thread's watchdog reads this
+        self._last_rx_ts = float("-inf")
+
         # configure topic subscriptions before starting threads
         self._configure_sub_port_state()
         self._configure_sub_node_state()
@@ -172,13 +219,11 @@ class HostDeviceStateSerdes:
         # threads
         self.t_transmit = threading.Thread(target=self._transmit_thread, name=self.node + "_serdes_transmit", daemon=True)
         self.t_receive = threading.Thread(target=self._receive_thread, name=self.node + "_serdes_receive", daemon=True)
-        self.t_trig_conn = threading.Thread(target=self._trigger_connect_thread, name=self.node + "_serdes_trig_conn", daemon=True)
         self.t_file_request = threading.Thread(target=self._file_request_thread, name=self.node + "_serdes_file_request", daemon=True)
 
         # go
         self.t_transmit.start()
         self.t_receive.start()
-        self.t_trig_conn.start()        
         self.t_file_request.start()
         
     # ---------- Public API ----------
@@ -188,7 +233,7 @@ class HostDeviceStateSerdes:
             self.port.close()
         except Exception:
             pass
-        for t in (self.t_transmit, self.t_receive, self.t_trig_conn, self.t_file_request):
+        for t in (self.t_transmit, self.t_receive, self.t_file_request):
             try:
                 t.join(timeout=1.0)
             except Exception:
@@ -197,117 +242,146 @@ class HostDeviceStateSerdes:
     # ---------- Thread 1: transmitter ----------
     def _transmit_thread(self) -> None:
         """
-        When signaled, serialize local state and send to device,
-        then block for a reply (or timeout + recover).
+        Ticks every `max_poll_s`: reports port status, and when signaled (or every `default_poll_s`),
+        serializes local state and sends it to the device.
+        Writes don't wait for their reply (the node answers every frame, the receive thread publishes it);
+        instead a watchdog calls `recover()` if no state message has arrived for `rx_timeout_s` while connected.
+        Recovery runs in tick-sized slices, so port status and refresh requests keep being serviced while the node
+        is silent; state polls are held back until it answers again.
+        Idle polls are never skipped: the empty command is what pulls fresh status from the node,
+        so there's no "clean" state to short-circuit on. They're just cheap (pre-serialized bytes).
         """
+        last_tx = float("-inf")     #monotonic time of our last transmission
+        watch_start = None          #monotonic time the watchdog started counting from (None while disconnected)
+        recovering = False          #whether the watchdog is currently trying to recover the link
+        #`recover()` attempts per tick: one tick's worth of recovery bytes at its inter-byte delay
+        recover_delay_s = 0.02
+        recover_attempts = max(1, int(self.max_poll_s / recover_delay_s))
         while not self.stop.is_set():
-            # wait until we either want state or we time out for a gentle poll
-            self.refresh_state_signal.wait(self.default_poll_s)
+            #publish the status of the serial port
+            self._update_port_status()
+
+            #watchdog: connected, talking to the node, but nothing has come back for a whole receive timeout
+            if self.port.port_connected:
+                now = time.monotonic()
+                if watch_start is None:
+                    watch_start = now
+                if now - max(self._last_rx_ts, watch_start) > self.rx_timeout_s:
+                    if not recovering:
+                        self.log.info("RX timeout; attempting recover()")
+                        recovering = True
+                    #blocks for at most about a tick; if nothing came back, carry on next tick
+                    if self.port.recover(attempts=recover_attempts, inter_delay_s=recover_delay_s):
+                        recovering = False
+                        watch_start = time.monotonic()  #give the recovered link a full timeout before trying again
+            else:
+                watch_start = None
+                recovering = False
+
+            #turn an external refresh request (or waiting commands) into a state request
+            #buffering the request lets us rate limit the state updates; doesn't spam the node with comms
+            if self.refresh_state_signal_external.is_set() or self._command_queue.qsize() > 0:
+                self.refresh_state_signal_external.clear()
+                self.refresh_state_signal.set()
+
+            # no state polls while recovering (the recovery bytes are what's going out); that `recover()` call
+            # already took up this tick, and any refresh request stays pending until the link is back
+            if recovering:
+                continue
+
+            # transmit if we want state (at most once per `max_poll_s`), or it's time for a gentle poll
+            # otherwise sleep for a tick
+            since_tx = time.monotonic() - last_tx
+            if not (
+                (self.refresh_state_signal.is_set() and since_tx >= self.max_poll_s)
+                or since_tx >= self.default_poll_s
+            ):
+                self.stop.wait(self.max_poll_s)
+                continue
             self.refresh_state_signal.clear()
+            last_tx = time.monotonic()
 
             # if we're not connected, we can't do anything, skip everything below
             if not self.port.port_connected:
                 continue
 
             # pull a command from the command queue
-            # if none, create an empty command so we can pull state information from the device
-            # use the NodeStateDefaults class to pull this empty command
+            # if none, send the (pre-serialized) empty command so we can pull state information from the device
             try:
                 command = self._command_queue.get_nowait()
             except Empty:
-                command = NodeStateDefaults.default_command_empty()
+                command = None
                 # Note: Not logging here to avoid spam during idle polling
 
-            # serialize this command by packing it into a communication message
-            try:
-                comm = Communication(node_state=command) 
-                outbound_bytes = bytes(comm)
-            except Exception as e:
-                self.log.warning(f"encode failed: {e}")
-                continue
-
-            # fire and wait for acknowledgement (any inbound frame will set rx_frame_seen)
-            self.rx_frame_received_signal.clear()
+            # serialize this command by packing it into our reused communication message
+            if command is None:
+                outbound_bytes = self._empty_command_bytes
+            else:
+                self._last_state_frame = None
+                try:
+                    self._tx_comm.node_state = command
+                    outbound_bytes = bytes(self._tx_comm)
+                except Exception as e:
+                    self.log.warning("encode failed: %s", e)
+                    continue
+
+            # fire and forget; the reply is picked up by the receive thread (and watched for above)
             self.port.write_frame(outbound_bytes)  # framed by Host_Serial 
 
-            if not self.rx_frame_received_signal.wait(self.rx_timeout_s):
-                # No RX -> check connection and try recover
-                if self.port.port_connected:
-                    self.log.info("RX timeout; attempting recover()")
-                    self.port.recover()
-                continue
-
     # ---------- Thread 2: RX consumer / deserializer ----------
     def _receive_thread(self) -> None:
         while not self.stop.is_set():
             #blocking wait for a frame to pop into our queue
-            #should fire instantly if we get data
-            frame = self.port.read_frame(wait=True, timeout=0.02)
+            #fires instantly if we get data, and closing the port wakes us immediately too
+            #so the timeout is just a safety net for re-checking `stop`; an idle link costs one wakeup a second
+            frame = self.port.read_frame(wait=True, timeout=1.0)
 
-            #if we didn't get a payload, wait a bit and try again
+            #if we didn't get a payload, try again
             if frame is None:
                 continue
 
+            #node reported exactly the same state as last time: still a reply, but nothing new to decode/publish
+            if frame == self._last_state_frame:
+                self._last_rx_ts = time.monotonic()
+                continue
+
             #deserialize/parse the protobuf
             try:
                 comm = Communication().parse(frame)
             except Exception as e:
-                self.log.warning(f"decode failed: {e}")
+                #lazy %-args (as for all per-frame logging): formatted only if the record is actually emitted
+                self.log.warning("decode failed: %s", e)
                 continue
 
             # route by payload kind using oneof discriminator to avoid AttributeError
-            try:
-                which, payload = betterproto.which_one_of(comm, "payload")
-            except Exception as e:
-                self.log.warning(f"Failed to discriminate payload type: {e}")
-                which, payload = (None, None)
+            # read the oneof's current field name straight off the message (what `betterproto.which_one_of` does internally;
+            # betterproto is pinned, see pyproject) rather than going through the generic helper per frame
+            which = comm._group_current.get("payload")
+            payload = getattr(comm, which) if which else None
 
             # if payload is a node state message, publish payload as node state message
-            # and signal that we've received a response from the node (since node only sends as response to transmitted message)
+            # and note that we've received a response from the node (since node only sends as response to transmitted message)
             if which == "node_state" and payload is not None:
+                self._last_state_frame = frame
+                self._last_rx_ts = time.monotonic() #feeds the transmit thread's watchdog
                 self._pub_node_state(payload)
-                self.rx_frame_received_signal.set() #notify that we received a state message
 
             #and if the payload is a file request response, publish the payload as a file response
             #and signal that we've received a response from the node (since node only sends as a response to transmitted message)
             elif which == "neural_mem_request" and payload is not None:
                 self._pub_file_response(payload)
-                self.rx_file_response_signal.set() #notify that we received a file request response
+                self._file_response_queue.put(payload) #hand the response to the file request thread
             
             #if payload is a debug message, publish payload as debug message
-            # don't notify tx thread that we've received a response to our transmission (since debug messages are asynchronous + unrelated to commands)
+            # doesn't count as a response to our transmission for the watchdog (since debug messages are asynchronous + unrelated to commands)
             elif which == "debug_message" and payload is not None:
                 self._pub_debug(payload)
             
             #if payload is unknown, log a warning
             else:
-                self.log.warning(f"unknown payload type: {which}")
+                self.log.warning("unknown payload type: %s", which)
     
-    # ---------- Thread 3: IO control + command topics ----------
-    def _trigger_connect_thread(self) -> None:
-        while not self.stop.is_set():
-            #port connection handled directly in callback function
-            #new state request and acknowledgement handled directly in callback function
-
-            #publish the status of the serial port
-            self._pub_port_state(
-                stat_connected=self.port.port_connected,
-                stat_port_name=self.port.port_name,
-                stat_serial_number=self.port.serial_number,
-                stat_commands_enqueued=self._command_queue.qsize(),
-                stat_command_queue_space=self._command_queue.maxsize - self._command_queue.qsize()
-            )
-
-            #push the state request to the transmit thread
-            #having a buffered state request lets us rate limit the state updates; doesn't spam the node with comms
-            if self.refresh_state_signal_external.is_set() or self._command_queue.qsize() > 0:
-                self.refresh_state_signal_external.clear()
-                self.refresh_state_signal.set()
-
-            #rate limit by sleeping this thread 
-            self.stop.wait(timeout=self.max_poll_s)
-
-    # ---------- Thread 4: file request thread ----------
+    # ---------- Thread 3: file request thread ----------
     def _file_request_thread(self) -> None:
         while not self.stop.is_set():
             # wait until the file request queue has something in it (with timeout to allow clean shutdown)
@@ -329,11 +403,18 @@ class HostDeviceStateSerdes:
                 self.log.warning(f"encode failed: {e}")
                 continue
 
-            # fire and wait for acknowledgement (uses separate signal from state messages)
-            self.rx_file_response_signal.clear()
+            # drop any stale response (to an earlier request that timed out), then fire and wait for ours
+            # (file responses have their own queue, separate from state messages)
+            while True:
+                try:
+                    self._file_response_queue.get_nowait()
+                except Empty:
+                    break
             self.port.write_frame(outbound_bytes)  # framed by Host_Serial 
 
-            if not self.rx_file_response_signal.wait(self.rx_timeout_s):
+            try:
+                self._file_response_queue.get(timeout=self.rx_timeout_s)
+            except Empty:
                 # No RX -> check connection and try recover
                 if self.port.port_connected:
                     self.log.info("RX timeout on file request; attempting recover()")
@@ -347,6 +428,17 @@ class HostDeviceStateSerdes:
         pub.subscribe(self._on_refresh_state, f"{self.root}.port.command.refresh_state")
         pub.subscribe(self._on_request_connect, f"{self.root}.port.command.request_connect")
 
+    def _update_port_status(self) -> None:
+        #port connection handled directly in callback function
+        #new state request and acknowledgement handled directly in callback function
+        self._pub_port_state(
+            stat_connected=self.port.port_connected,
+            stat_port_name=self.port.port_name,
+            stat_serial_number=self.port.serial_number,
+            stat_commands_enqueued=self._command_queue.qsize(),
+            stat_command_queue_space=self._command_queue.maxsize - self._command_queue.qsize()
+        )
+
     def _pub_port_state(self, 
                         *, 
                         stat_connected: bool, 
@@ -355,11 +447,28 @@ class HostDeviceStateSerdes:
                         stat_commands_enqueued: int,
                         stat_command_queue_space: int) -> None:
         # publish on change-only using topic-based cache
-        pub.sendMessage(f"{self.root}.port.status.connected", payload=stat_connected)
-        pub.sendMessage(f"{self.root}.port.status.port_name", payload=stat_port_name if stat_port_name is not None else "---")
-        pub.sendMessage(f"{self.root}.port.status.serial_number", payload=stat_serial_number if stat_serial_number is not None else "---")
-        pub.sendMessage(f"{self.root}.port.status.commands_enqueued", payload=stat_commands_enqueued)
-        pub.sendMessage(f"{self.root}.port.status.command_queue_space", payload=stat_command_queue_space)
+        self._pub_change(self._topic_port_connected, stat_connected)
+        self._pub_change(self._topic_port_name, stat_port_name if stat_port_name is not None else "---")
+        self._pub_change(self._topic_port_serial_number, stat_serial_number if stat_serial_number is not None else "---")
+        self._pub_change(self._topic_port_commands_enqueued, stat_commands_enqueued)
+        self._pub_change(self._topic_port_command_queue_space, stat_command_queue_space)
+
+    def _pub_change(self, topic: str, value: Any) -> None:
+        # values here are small scalars (bool/int/str), so compare directly; identity check first is the cheap common case
+        # type is part of the key so e.g. 0 -> False still publishes
+        last = self._last_pub.get(topic, _UNSET)
+        if last is value or (type(last) is type(value) and last == value):
+            return
+        self._last_pub[topic] = value
+        self._send(topic, value)
+
+    def _send(self, topic: str, payload: Any) -> None:
+        # same as `pub.sendMessage(topic, payload=...)`, minus resolving the topic name on every send
+        # the Topic object is looked up (or created) once and kept; publish() still does the MDS check + listener dispatch
+        topic_obj = self._topic_objs.get(topic)
+        if topic_obj is None:
+            topic_obj = self._topic_objs[topic] = pub.getDefaultTopicMgr().getOrCreateTopic(topic)
+        topic_obj.publish(payload=payload)
 
     ###### NODE STATE ######
     def _configure_sub_node_state(self) -> None:
@@ -368,7 +477,7 @@ class HostDeviceStateSerdes:
 
     def _pub_node_state(self, node_state: NodeState) -> None:
         #publish the node state directly to the status topic
-        pub.sendMessage(f"{self.root}.status", payload=node_state)
+        self._send(self._topic_status, node_state)
 
     ###### DEBUG ######
     def _configure_sub_debug(self) -> None:
@@ -376,11 +485,13 @@ class HostDeviceStateSerdes:
         pass
 
     def _pub_debug(self, debug_message: Debug) -> None:        
-        #extract the topic from the stringified version of the debug level
-        debug_topic = f"{self.root}.debug.{debug_message.level.name}"
+        #look up the topic for this debug level (built from the stringified level names at init)
+        debug_topic = self._topics_debug.get(debug_message.level)
+        if debug_topic is None:
+            debug_topic = f"{self.root}.debug.{debug_message.level.name}"
         
         #publish the debug message to the correct status topic
-        pub.sendMessage(debug_topic, payload=debug_message.msg)
+        self._send(debug_topic, debug_message.msg)
 
     ###### FILE RESPONSE ######
     def _configure_sub_file_request(self) -> None:
@@ -389,7 +500,7 @@ class HostDeviceStateSerdes:
 
     def _pub_file_response(self, file_request: NeuralMemFileRequest) -> None:
         #publish the file request directly to the status topic
-        pub.sendMessage(f"{self.root}.file_response", payload=file_request)
+        self._send(self._topic_file_response, file_request)
 
     #------------------------------- Callback Functions ---------------------------------
     def _on_request_connect(self, payload: Any = None) -> None:
@@ -421,8 +532,10 @@ class HostDeviceStateSerdes:
         if isinstance(payload, bool):
             if payload:
                 self.refresh_state_signal_external.set()
+                #a refresh also re-sends every port status topic, in case a subscriber missed the original
+                self._last_pub.clear()
                 #clear the request flag to acknowledge service (MAY REENTER, should be fine)
-                pub.sendMessage(f"{self.root}.port.command.refresh_state", payload=False)
+                pub.sendMessage(self._topic_refresh_state, payload=False)
         else:
             self.log.warning(f"invalid refresh state type: {type(payload)} (expected bool)")
 
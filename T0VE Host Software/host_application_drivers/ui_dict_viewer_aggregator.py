@@ -1,20 +1,56 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Tuple, Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Tuple, Optional
 import threading
+import time
 import copy
+import sys
 import logging
 
 from pubsub import pub
 from host_application_drivers.util_flat_dict import FlatDict
-from host_application_drivers.util_match_type_runtime import match_type
+from host_application_drivers.util_match_type_runtime import type_matcher
 
 Path = Tuple[Any, ...]
 
+_UNSET = object()   #sentinel: nothing published to a frontend widget yet
+
+# leaf types that can be shared between snapshots as-is (no copy needed)
+_IMMUTABLE_LEAF_TYPES = frozenset((bool, int, float, str, bytes, type(None)))
+
+def _leaf_copier(value: Any) -> Optional[Callable[[Any], Any]]:
+    '''
+    how to copy a leaf shaped like `value`; None if it can be shared as-is
+    flat arrays of scalars (the common container leaf) only need a shallow copy, or none at all for tuples
+    '''
+    value_type = type(value)
+    if value_type in _IMMUTABLE_LEAF_TYPES:
+        return None
+    if value_type in (list, tuple) and all(type(element) in _IMMUTABLE_LEAF_TYPES for element in value):
+        return list.copy if value_type is list else None
+    return copy.deepcopy
+
+def _copy_nested(nested: Dict[Any, Any]) -> Dict[Any, Any]:
+    '''
+    copy of a nested snapshot: every dict level and container leaf is new, immutable leaves are shared
+    each level is copied in one go (`dict.copy`), then only its sub-dicts and container leaves are replaced
+    '''
+    out = nested.copy()
+    for key, value in nested.items():
+        value_type = type(value)
+        if value_type is dict:
+            out[key] = _copy_nested(value)
+        elif value_type not in _IMMUTABLE_LEAF_TYPES:
+            copier = _leaf_copier(value)
+            if copier is not None:
+                out[key] = copier(value)
+    return out
+
 class DictViewerAggregator:
     '''
     Constructor for the DictViewerAggregator class.
     - reference_dict: the reference dictionary to use for the aggregator (should be shared with the frontend)
+    - flat_reference_dict: optional, already-flattened `reference_dict` (`FlatDict.flatten` output); skips re-flattening if the caller has one
     - ui_topic_root: the root topic to use for the pub/sub interface; all topics will be prefixed with this root
     - ui_max_publish_rate_s: the maximum rate at which the aggregator can publish updated dictionary values to subscribers
     - logger: the logger to use for the aggregator
@@ -22,6 +58,7 @@ class DictViewerAggregator:
     topic format:
     [ui_topic_root].frontend.set.[path1].[path2].[path3]...[pathN]  #listener of all individual dictionary entries (UI side, DON'T TOUCH)
     [ui_topic_root].frontend.get.[path1].[path2].[path3]...[pathN]  #publisher of all individual dictionary entries (UI side, DON'T TOUCH)
+    [ui_topic_root].frontend.refresh                                #listener of frontend requests to re-send a subtree (UI side, DON'T TOUCH)
     [ui_topic_root].entries.set.[path1].[path2].[path3]...[pathN]   #listener of individual dictionary entries 
     [ui_topic_root].entries.get.[path1].[path2].[path3]...[pathN]   #publisher of individual dictionary entries 
     [ui_topic_root].nested.set                                      #listener of the entire nested dictionary 
@@ -35,6 +72,10 @@ class DictViewerAggregator:
      - external users can subscribe to entries.get or nested.get to get the current value of the dictionary
         - aggregator will forward publishes to frontend.get to entries.get
         - aggregator will only publish to nested.get when it receives a frontend.get publish
+     - frontend.set publishes are skipped when the widget already shows that value (per-path publish cache)
+     - at startup only nested.get is published; frontend widgets are assumed to be built from the same reference dictionary
+     - widgets built later (lazily built tabs) request their subtree's current values through frontend.refresh
+     - nested.get publishes are skipped when the snapshot matches the last one sent, unless an external update came in since
     '''
 
     '''
@@ -46,6 +87,7 @@ class DictViewerAggregator:
     def __init__(   self, 
                     *,
                     reference_dict: Dict[Any, Any],
+                    flat_reference_dict: Optional[Dict[Path, Any]] = None,
                     editable_paths: Optional[Iterable[Path]] = None,
                     ui_topic_root: str = "app.ui",
                     ui_max_publish_rate_s: float = 0.1,
@@ -61,17 +103,39 @@ class DictViewerAggregator:
         # we'll flatten the dictionary to a single layer for easy spontaneous writes from publishers
         # publish cache ensures publishes only occur when dictionary values change; reduces pub/sub traffic
         # topic_for_path is a dictionary of paths to topics for easy lookup; can compute once and use later
-        self._flat_dict = FlatDict.flatten(reference_dict)
-        self._publish_cache: Dict[str, Any] = {}
+        # (shallow copy of a caller-provided flattening--we write into our flat dict)
+        if flat_reference_dict is not None:
+            self._flat_dict = dict(flat_reference_dict)
+        else:
+            self._flat_dict = FlatDict.flatten(reference_dict)
+        self._publish_cache: Dict[Path, Any] = {}      #last value sent to (or edited in) each frontend widget
+        self._last_nested_published: Optional[Dict[Any, Any]] = None    #last nested.get snapshot; None forces the next publish
+        self._flat_version: int = 0                                         #bumped on every flat dict write
+        self._nested_cache: Optional[Tuple[int, Dict[Any, Any]]] = None     #(flat version, nested snapshot) from the last `_snapshot`
         self._topic_for_path: Dict[Path, str] = {path: self._topic_from_path(path) for path in self._flat_dict.keys()}
+        # per-path type checkers, specialized once from the reference values (leaf types never change afterwards)
+        self._type_matcher_for_path: Dict[Path, Callable[[Any], bool]] = {path: type_matcher(value) for path, value in self._flat_dict.items()}
+        # how to copy each container leaf (see `_leaf_copier`); paths not listed hold immutable values and are shared as-is
+        self._copier_for_path: Dict[Path, Callable[[Any], Any]] = {path: copier for path, copier in
+                                                                   ((path, _leaf_copier(value)) for path, value in self._flat_dict.items())
+                                                                   if copier is not None}
+
+        # full topics the runtime handlers publish to, built once per path so no topic string is assembled per event
+        # (interned, as the frontend's are, so both sides hand pubsub the same string object for a topic)
+        self._frontend_set_topic: Dict[Path, str] = {path: sys.intern(f"{self._ui_topic_root}.frontend.set.{topic}") for path, topic in self._topic_for_path.items()}
+        self._entries_get_topic: Dict[Path, str] = {path: sys.intern(f"{self._ui_topic_root}.entries.get.{topic}") for path, topic in self._topic_for_path.items()}
+        self._nested_get_topic: str = f"{self._ui_topic_root}.nested.get"
 
         # threading events
         # lock ensures thread-safe access to the dictionary
-        # ui_update_event is set when a UI-driven update is received
+        # ui_update_event is set when a UI-driven update is received (for `wait_ui_update`/`is_ui_update` callers)
+        # ui_update_cond/ui_dirty wake the publisher thread on a UI-driven update (separate from the event so API callers don't consume it)
         # ui_update_publisher is a thread that publishes the edited when UI edits are made
         # stop is a thread stop event to best-effort close other threads upon shutdown
         self._lock = threading.RLock()
         self._ui_update_event = threading.Event()
+        self._ui_update_cond = threading.Condition()
+        self._ui_dirty: bool = False
         self._ui_update_publisher = threading.Thread(   target=self._ui_update_publisher_thread, 
                                                         name="dict_viewer_aggregator_ui_update_publisher_" + self._ui_topic_root, 
                                                         daemon=True)
@@ -79,39 +143,44 @@ class DictViewerAggregator:
         self._stop = threading.Event()
 
         ###### SUBSCRIPTION SETUP ######
+        # per-path listeners are small closures with the path bound in (see `_make_path_listener`)
+        # pubsub only holds weak references to listeners, so we keep them alive here
+        self._path_listeners: List[Callable[..., None]] = []
+
         # subscribe to external path publishes
         for path in self._flat_dict.keys():
-            pub.subscribe(  self._on_external_path_publish,                                     # callback
-                            f"{self._ui_topic_root}.entries.set.{self._topic_for_path[path]}",  # topic
-                            path=path)                                                          # curried path argument
+            pub.subscribe(  self._make_path_listener(self._on_external_path_publish, path),     # callback, bound to path
+                            f"{self._ui_topic_root}.entries.set.{self._topic_for_path[path]}")  # topic
 
         # subscribe to external nested publishes
         pub.subscribe(  self._on_external_nested_publish,       # callback
                         f"{self._ui_topic_root}.nested.set")    # topic
 
+        # subscribe to frontend requests to re-send current values (e.g. a tab built after startup)
+        pub.subscribe(  self._on_frontend_refresh,                  # callback
+                        f"{self._ui_topic_root}.frontend.refresh")  # topic
+
         # subscribe to frontend widget publishes
         # ONLY FOR EDITABLE TOPICS
-        # normalize editable_paths so None means "no editable paths"
-        editable_paths = list(editable_paths) if editable_paths is not None else []
-        for editable_path in editable_paths:
+        # normalize editable_paths so None means "no editable paths"; frozen once, O(1) membership from here on
+        self._editable_paths: FrozenSet[Path] = frozenset(editable_paths) if editable_paths is not None else frozenset()
+        for editable_path in self._editable_paths:
             if editable_path in self._flat_dict:
-                pub.subscribe(  self._on_frontend_widget_publish,                                               # callback
-                                f"{self._ui_topic_root}.frontend.get.{self._topic_for_path[editable_path]}",    # topic
-                                path=editable_path)                                                             # curried path argument
+                pub.subscribe(  self._make_path_listener(self._on_frontend_widget_publish, editable_path),      # callback, bound to path
+                                f"{self._ui_topic_root}.frontend.get.{self._topic_for_path[editable_path]}")    # topic
             else:
                 self._log.warning(f"DictViewerAggregator: Editable path {editable_path} not in reference dictionary.")
 
         ###### INITIAL PUBLISHES ######
-        # publish all flat dict entries to the `entries.set` topic
-        for path in self._flat_dict.keys():
-            pub.sendMessage(f"{self._ui_topic_root}.entries.set.{self._topic_for_path[path]}", payload=self._flat_dict[path])
+        # the whole initial state goes out as one publish to the `nested.get` topic
+        self._last_nested_published = self._snapshot()
+        pub.sendMessage(self._nested_get_topic, payload=_copy_nested(self._last_nested_published))
 
-        # publish the nested dictionary to the `nested.get` topic
-        pub.sendMessage(f"{self._ui_topic_root}.nested.get", payload=self.pull())
-
-        # and publish all entries to the frontend widgets
-        for path in self._flat_dict.keys():
-            pub.sendMessage(f"{self._ui_topic_root}.frontend.set.{self._topic_for_path[path]}", payload=self._flat_dict[path])
+        # no per-entry startup publishes:
+        #  - `entries.set` only has ourselves as a listener, so echoing every entry there just re-pushed our own values
+        #  - frontend widgets are built from the same reference dictionary, so they already show these values;
+        #    seed the publish cache with them instead of sending one `frontend.set` per entry
+        self._publish_cache.update(self._flat_dict)
 
         #now start the UI update publisher now that everything is ready
         self._log.info("Starting UI update publisher thread.")
@@ -126,7 +195,8 @@ class DictViewerAggregator:
         """
         self._log.info("Shutting down DictViewerBackend, stopping threads...")
         self._stop.set()
-        self._ui_update_event.set() #get the ui update publisher to skip the wait on change
+        with self._ui_update_cond:  #get the ui update publisher to skip the wait on change
+            self._ui_update_cond.notify()
         try:
             self._ui_update_publisher.join(timeout=1.0)
         except Exception as e:
@@ -137,16 +207,12 @@ class DictViewerAggregator:
         """
         Build and return a nested snapshot with the same structure as
         the reference dictionary, using current flattened values.
+        The caller gets its own copy, free to modify.
 
         Thread-safe.
         """
-        #take a snapshot of the flat dictionary at the time of function call
-        with self._lock:    
-            flat_copy = copy.deepcopy(self._flat_dict)
-        
-        #unflatten the flat dictionary to make it a nested dictionary in the same form of reference
-        nested = FlatDict.unflatten(flat_copy)
-        return nested
+        #copy the cached snapshot rather than rebuilding it from the flat dictionary
+        return _copy_nested(self._snapshot())
 
     def push(self, nested_update: Dict[Any, Any]) -> None:
         """
@@ -154,11 +220,16 @@ class DictViewerAggregator:
         any changes out to their corresponding topics.
         Update frontend with all edited topics, but publish to `get` topics
         """
-        updated_paths = self._push_no_publish(nested_update)
-        if updated_paths:
-            #if we performed an update, publish entry-wise updates to frontend
-            for path in updated_paths:
-                pub.sendMessage(f"{self._ui_topic_root}.frontend.set.{self._topic_from_path(path)}", payload=self._flat_dict[path])
+        #single-leaf updates (one key per level all the way down) skip the general flatten
+        single_leaf = self._single_leaf_update(nested_update)
+        if single_leaf is not None:
+            self.push_path(*single_leaf)
+            return
+
+        #if we performed an update, publish entry-wise updates to frontend
+        #(values were captured while applying the update, so publishing happens outside the lock)
+        for path, value in self._push_no_publish(nested_update):
+            self._publish_frontend(path, value)
 
     def pull_path(self, path: Path) -> Any:
         """
@@ -179,7 +250,7 @@ class DictViewerAggregator:
         updated = self._push_path_no_publish(path, new_val)
         if updated:
             #if we performed an update, publish to the frontend.set topic
-            pub.sendMessage(f"{self._ui_topic_root}.frontend.set.{self._topic_from_path(path)}", payload=new_val)
+            self._publish_frontend(path, new_val)
 
     def wait_ui_update(self, timeout: Optional[float] = None) -> bool:
         """
@@ -212,51 +283,164 @@ class DictViewerAggregator:
         Thread function for publishing UI-driven updates.
         """
         self._log.debug("UI update publisher thread started.")
+        last_publish_s = float("-inf")
         while not self._stop.is_set():
-            #wait for an update, then publish using 
-            self.wait_ui_update()
-            
-            #publish the nested dictionary to the nested dictionary topic
-            pub.sendMessage(f"{self._ui_topic_root}.nested.get", payload=self.pull())
+            #sleep until a UI edit marks us dirty (no periodic wakeups while idle)
+            with self._ui_update_cond:
+                while not self._ui_dirty and not self._stop.is_set():
+                    self._ui_update_cond.wait()
+            if self._stop.is_set():
+                break
+
+            #rate limit to the max publish rate, measured from the last publish rather than slept after every one
+            #edits landing during this wait are coalesced into the snapshot below
+            remaining_s = last_publish_s + self._ui_max_publish_rate_s - time.monotonic()
+            if remaining_s > 0 and self._stop.wait(remaining_s):
+                break
+            with self._ui_update_cond:
+                self._ui_dirty = False
 
-            #rate limit the publish to the max publish rate
-            self._stop.wait(self._ui_max_publish_rate_s)
+            #publish the nested dictionary to the nested dictionary topic
+            #unless it's exactly what we sent last time (e.g. an entry lost focus without its value changing)
+            #(compared on the shared snapshot; listeners get their own copy)
+            snapshot = self._snapshot()
+            if snapshot is not self._last_nested_published and snapshot != self._last_nested_published:
+                self._last_nested_published = snapshot
+                pub.sendMessage(self._nested_get_topic, payload=_copy_nested(snapshot))
+                last_publish_s = time.monotonic()
 
     # -------------------------------------------------------------------------
     # Internal helpers: message handlers
     # -------------------------------------------------------------------------
 
     def _on_frontend_widget_publish(self, payload: Any = None, path: Path = None) -> None:
+        # early out without the lock when the widget relays the value we already hold (e.g. focus-out without an edit)
+        # single-key dict reads are atomic; if a write races us we just take the locked path below
+        current = self._flat_dict.get(path, _UNSET)
+        if type(current) is type(payload) and current == payload:
+            return
+
         # forward to internal helper directly
         updated = self._push_path_no_publish(path, payload)
         if updated:
+            #the widget now shows the user's value; remember that, so a later external push of the old value still reaches it
+            self._publish_cache[path] = payload
+
             #if we get a UI publish, push the topic to the pathwise `get` topic
-            pub.sendMessage(f"{self._ui_topic_root}.entries.get.{self._topic_from_path(path)}", payload=payload)
+            pub.sendMessage(self._entries_get_topic[path], payload=payload)
 
             #and schedule a nested dictionary broadcast
             self._ui_update_event.set()
+            with self._ui_update_cond:
+                self._ui_dirty = True
+                self._ui_update_cond.notify()
+
+    def _on_frontend_refresh(self, payload: Path = ()) -> None:
+        # re-send every entry under the requested path prefix, even if the publish cache says it went out already
+        # (the widgets showing it may not have existed yet)
+        with self._lock:
+            entries = [(path, value) for path, value in self._flat_dict.items() if path[:len(payload)] == payload]
+        for path, value in entries:
+            self._publish_cache.pop(path, None)
+            self._publish_frontend(path, value)
 
     def _on_external_path_publish(self, payload: Any = None, path: Path = None) -> None:
         # directly forward to API push--takes care of sanity checking parameters
         # and publishing to frontend on change
+        # an external update means the next UI edit should go out even if the snapshot matches our last one
+        self._last_nested_published = None
         self.push_path(path, payload)
 
     def _on_external_nested_publish(self, payload: Any = None) -> None:
         # directly forward to API push--takes care of sanity checking parameters
         # and publishing to frontend on change
+        # (same nested.get cache invalidation as above)
+        self._last_nested_published = None
         self.push(payload)
 
     # -------------------------------------------------------------------------
     # Internal helpers
     # -------------------------------------------------------------------------
+    def _make_path_listener(self, handler: Callable[[Any, Path], None], path: Path) -> Callable[..., None]:
+        '''
+        build a pubsub listener that calls `handler(payload, path)` for one fixed path
+        (cheaper per message than a curried `path=` subscription, which pubsub merges into the call kwargs every time)
+        the listener is kept in `_path_listeners` so it outlives pubsub's weak reference
+        '''
+        def _on_path_publish(payload: Any = None) -> None:
+            handler(payload, path)
+        self._path_listeners.append(_on_path_publish)
+        return _on_path_publish
+
     def _topic_from_path(self, path: Path) -> str:
         """
         Build a pubsub outbound topic string from a path
         UI elements will subscribe to this topic to get the current value of the dictionary
         and update the UI elements accordingly
         """
+        #paths are almost always all string keys, which join as-is; only coerce mixed paths (e.g. list indices)
+        if all(type(p) is str for p in path):
+            return ".".join(path)
         return ".".join(str(p) for p in path)
 
+    @staticmethod
+    def _single_leaf_update(nested_update: Dict[Any, Any]) -> Optional[Tuple[Path, Any]]:
+        '''
+        return (path, value) if `nested_update` holds exactly one leaf, else None (general update)
+        '''
+        path: Path = ()
+        value: Any = nested_update
+        while isinstance(value, dict):
+            if len(value) != 1:
+                return None
+            (key, value), = value.items()
+            path += (key,)
+        return path, value
+
+    def _snapshot(self) -> Dict[Any, Any]:
+        '''
+        the current nested snapshot, reused until the next write
+        shared with every other caller (and `_last_nested_published`), so never modify or hand it out; see `pull`
+        '''
+        #take a snapshot of the flat dictionary at the time of function call
+        #leaves are almost all immutable scalars, so only container leaves (e.g. lists) need copying
+        with self._lock:
+            #nothing written since the last snapshot, hand that one out again
+            if self._nested_cache is not None and self._nested_cache[0] == self._flat_version:
+                return self._nested_cache[1]
+            version = self._flat_version
+            flat_copy = dict(self._flat_dict)
+            for path, copier in self._copier_for_path.items():
+                flat_copy[path] = copier(flat_copy[path])
+        
+        #unflatten the flat dictionary to make it a nested dictionary in the same form of reference
+        nested = FlatDict.unflatten(flat_copy)
+
+        #cache it, unless a write landed while we were unflattening
+        with self._lock:
+            if version == self._flat_version:
+                self._nested_cache = (version, nested)
+        return nested
+
+    def _publish_frontend(self, path: Path, value: Any) -> None:
+        '''
+        publish a value to the frontend widget at `path`, skipping the publish if the widget already shows it
+        type is part of the comparison so e.g. 0 -> False still publishes
+        '''
+        last = self._publish_cache.get(path, _UNSET)
+        if type(last) is type(value) and last == value:
+            return
+        self._publish_cache[path] = value
+        pub.sendMessage(self._frontend_set_topic[path], payload=value)
+
+    def _own_value(self, path: Path, new_val: Any) -> Any:
+        '''
+        return a value safe to store at `path`: a copy for container leaves, the value itself for immutable ones
+        (a value that passes the path's type check has the reference leaf's shape, so the per-path decision holds)
+        '''
+        copier = self._copier_for_path.get(path)
+        return new_val if copier is None else copier(new_val)
+
     def _push_path_no_publish(self, path: Path, new_val: Any) -> bool:
         '''
         push value to a specific path in the backend without publishing the change to the corresponding topic
@@ -264,34 +448,32 @@ class DictViewerAggregator:
         '''
         with self._lock:
             #sanity checking happens inside _update function
-            updated = self._update_flattened_dict(path, copy.deepcopy(new_val))
+            updated = self._update_flattened_dict(path, new_val)
             if not updated:
                 return False
 
             # if we got here, means we updated the dict
             return True
 
-    def _push_no_publish(self, nested_update: Dict[Any, Any]) -> set[Path]:
+    def _push_no_publish(self, nested_update: Dict[Any, Any]) -> List[Tuple[Path, Any]]:
         '''
         push a nested update to the backend without publishing the change to the corresponding topics
         useful for callbacks that originated from the pub/sub system as to avoid double publishes
         '''
         flat_update = FlatDict.flatten(nested_update)
 
-        #keep track of paths we updated so we can publish later if needed
-        updated_paths: set[Path] = set()
+        #keep track of paths we updated (and the values written) so we can publish later if needed
+        updated: List[Tuple[Path, Any]] = []
 
-        #go through all paths in our flattened dictionary and try to publish
-        for path, new_val in flat_update.items():
-            if self._push_path_no_publish(path, new_val):
-                updated_paths.add(path)
-            else:
-                #self._log.debug(f"Push skipped for path {path}: update/validation failed or value unchanged.")
-                pass
-                
+        #go through all paths in our flattened dictionary and try to update
+        #the whole update is applied under one lock acquisition rather than one per entry
+        with self._lock:
+            for path, new_val in flat_update.items():
+                if self._update_flattened_dict(path, new_val):
+                    updated.append((path, self._flat_dict[path]))
 
-        #return the set of paths we updated so the caller can publish later if needed
-        return updated_paths
+        #return the (path, value) pairs we updated so the caller can publish later if needed
+        return updated
 
     def _update_flattened_dict(self, path: Path, new_val: Any) -> bool:
         """
@@ -303,18 +485,23 @@ class DictViewerAggregator:
         """
 
         #check if the path exists in the reference dictionary
-        if path not in self._flat_dict:
+        #(the per-path checker table has exactly the reference paths, so one lookup answers both questions)
+        type_matcher_for_path = self._type_matcher_for_path.get(path)
+        if type_matcher_for_path is None:
             self._log.warning(f"_update_flattened_dict: Path {path} not in reference dictionary.")
             return False
 
-        if not match_type(new_val, self._flat_dict[path]):
+        if not type_matcher_for_path(new_val):
             self._log.warning(f"_update_flattened_dict: Type mismatch on {path}: {type(new_val)} != {type(self._flat_dict[path])}")
             return False
 
         #skip the update if the values are equal (return false since update isn't performed)
-        # if self._flat_dict[path] == new_val:
-        #     return False
+        #an unchanged entry then neither invalidates the cached nested snapshot nor gets re-published downstream
+        if self._flat_dict[path] == new_val:
+            return False
 
-        #otherwise update the flattened dictionary
-        self._flat_dict[path] = new_val
+        #otherwise update the flattened dictionary (invalidates the cached nested snapshot)
+        #container leaves are only copied here, once we know they changed
+        self._flat_dict[path] = self._own_value(path, new_val)
+        self._flat_version += 1
         return True
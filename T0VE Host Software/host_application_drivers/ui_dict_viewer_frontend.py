@@ -5,8 +5,12 @@ from __future__ import annotations
 from tkinter import ttk
 from typing import Any, Dict, Iterable, Optional, Sequence
 import logging
+import sys
+
+from pubsub import pub
 
 from host_application_drivers.ui_pubsub_widget_factory import SmartWidgetFactory
+from host_application_drivers.ui_pubsub_widget_table import SmartLeafTable
 from host_application_drivers.ui_dict_viewer_aggregator import Path
 
 
@@ -22,6 +26,10 @@ class DictViewerFrontend(ttk.Frame):
     Topic convention (must match DictViewerAggregator):
         listens to updates from aggregator:     <ui_topic_root>.frontend.set.<key1>.<key2>....<keyN>
         publishes updates to aggregator:        <ui_topic_root>.frontend.get.<key1>.<key2>....<keyN>
+        requests current values for a subtree:  <ui_topic_root>.frontend.refresh   (payload = path prefix)
+
+    Tabs other than the first are built the first time they're selected; the aggregator is then asked
+    to re-send current values for that tab, since its widgets missed any updates published before that.
 
     Parameters
     ----------
@@ -58,6 +66,9 @@ class DictViewerFrontend(ttk.Frame):
         self._ui_topic_root = ui_topic_root
         self._layout_pattern = layout_pattern or "v"
 
+        # resolve the layout mode for every depth in the pattern once; deeper levels reuse the last one
+        self._mode_by_depth: tuple[str, ...] = tuple(self._parse_mode(c) for c in self._layout_pattern)
+
         # Normalize editable paths into a set of tuples
         if editable_paths is None:
             self._editable_paths = set()
@@ -69,6 +80,9 @@ class DictViewerFrontend(ttk.Frame):
         style.configure("TNotebook.Tab", padding=(10, 4))
         style.configure("TabHeader.TLabel", font=("TkDefaultFont", 10, "bold"))
 
+        # tabs not yet built: tab widget name -> (content frame, nested dict, depth, path)
+        self._pending_tabs: Dict[str, tuple[ttk.Frame, Dict[Any, Any], int, Path]] = {}
+
         # Build UI from reference dict shape
         self._build_dict_ui(self, self._ref, depth=0, path=())
 
@@ -82,12 +96,15 @@ class DictViewerFrontend(ttk.Frame):
           'v' = vertical tiling
           't' = tabs
           If depth is greater than the length of the layout pattern, use the last character of the layout pattern
+          (looked up from the modes resolved at construction)
         """
-        if depth < len(self._layout_pattern):
-            c = self._layout_pattern[depth].lower()
-        else:
-            c = self._layout_pattern[-1].lower()
+        modes = self._mode_by_depth
+        return modes[depth] if depth < len(modes) else modes[-1]
 
+    @staticmethod
+    def _parse_mode(c: str) -> str:
+        """Resolve one layout pattern character to its mode ('h', 't', or the default 'v')."""
+        c = c.lower()
         if c.startswith("h"):
             return "h"
         if c.startswith("t"):
@@ -99,18 +116,25 @@ class DictViewerFrontend(ttk.Frame):
         Build a pubsub topic string for a given dict path such that it matches
         DictViewerAggregator._listen_topic_for_path:
             <ui_topic_root>.frontend.set.<key1>.<key2>...<keyN>
+        (interned, like the aggregator's copy of the same topic)
         """
-        suffix = ".".join(str(p) for p in path)
-        return f"{self._ui_topic_root}.frontend.set.{suffix}"
+        return sys.intern(f"{self._ui_topic_root}.frontend.set.{self._topic_suffix(path)}")
 
     def _publish_topic_for_path(self, path: Path) -> str:
         """
         Build a pubsub topic string for a given dict path such that it matches
         DictViewerAggregator._publish_topic_for_path:
             <ui_topic_root>.frontend.get.<key1>.<key2>...<keyN>
+        (interned, like the aggregator's copy of the same topic)
         """
-        suffix = ".".join(str(p) for p in path)
-        return f"{self._ui_topic_root}.frontend.get.{suffix}"
+        return sys.intern(f"{self._ui_topic_root}.frontend.get.{self._topic_suffix(path)}")
+
+    @staticmethod
+    def _topic_suffix(path: Path) -> str:
+        """Join a dict path into its topic suffix; all-string paths (the usual case) join without coercion."""
+        if all(type(p) is str for p in path):
+            return ".".join(path)
+        return ".".join(str(p) for p in path)
         
     def _is_editable(self, path: Path) -> bool:
         """Return True if this leaf path is editable."""
@@ -135,12 +159,25 @@ class DictViewerFrontend(ttk.Frame):
           - 't': tabs (one tab per key, with replicated header bar)
 
         Leaves that are None are not rendered.
+        A level made only of read-only leaves is rendered as a single table (see `_build_leaf_table`),
+        any other level made only of leaves as a single key/widget grid (see `_build_leaf_grid`).
         """
         # Filter out None-valued leaves at this level
         items = [(k, v) for k, v in data.items() if v is not None]
         if not items:
             return
 
+        # read-only leaf blocks: one Treeview instead of a LabelFrame + smart widget per leaf
+        # (editable leaves still need their entry/check widgets, so any editable leaf keeps the regular layout)
+        if not any(isinstance(v, dict) or self._is_editable(path + (k,)) for k, v in items):
+            self._build_leaf_table(parent, items, path)
+            return
+
+        # other leaf-only levels: no nested containers to lay out, so skip the LabelFrame per leaf
+        if not any(isinstance(v, dict) for _, v in items):
+            self._build_leaf_grid(parent, items, path)
+            return
+
         mode = self._mode_for_depth(depth)
 
         if mode == "t":
@@ -164,7 +201,7 @@ class DictViewerFrontend(ttk.Frame):
         notebook = ttk.Notebook(level_frame)
         notebook.pack(fill="both", expand=True)
 
-        for key, value in items:
+        for index, (key, value) in enumerate(items):
             child_path = path + (key,)
             tab = ttk.Frame(notebook)
             # Extra padding before/after tab label
@@ -190,11 +227,28 @@ class DictViewerFrontend(ttk.Frame):
             content = ttk.Frame(tab)
             content.pack(fill="both", expand=True, padx=4, pady=(0, 4))
 
-            if isinstance(value, dict):
+            # only the first (initially selected) tab is built now; other nested tabs wait until first selected
+            if isinstance(value, dict) and index > 0:
+                self._pending_tabs[str(tab)] = (content, value, depth + 1, child_path)
+            elif isinstance(value, dict):
                 self._build_dict_ui(content, value, depth + 1, child_path)
             else:
                 self._create_leaf_widget(content, key, value, child_path)
 
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event) -> None:
+        """
+        Build a tab's contents the first time it's selected, then have the aggregator re-send that subtree's
+        current values (the new widgets start from the reference values and missed any earlier updates).
+        """
+        pending = self._pending_tabs.pop(event.widget.select(), None)
+        if pending is None:
+            return
+        content, value, depth, path = pending
+        self._build_dict_ui(content, value, depth, path)
+        pub.sendMessage(f"{self._ui_topic_root}.frontend.refresh", payload=path)
+
     def _build_tiled(
         self,
         parent: ttk.Frame,
@@ -230,9 +284,8 @@ class DictViewerFrontend(ttk.Frame):
                 else:
                     self._create_leaf_widget(block, key, value, child_path)
 
-            # Make columns expand equally
-            for c in range(max_cols):
-                level_frame.grid_columnconfigure(c, weight=1)
+            # Make columns expand equally (Tk takes a list of column indices, so one call for all of them)
+            level_frame.grid_columnconfigure(tuple(range(max_cols)), weight=1)
 
         else:  # mode == "v"
             # Vertical stacking with wrapping into new columns
@@ -253,10 +306,43 @@ class DictViewerFrontend(ttk.Frame):
                 else:
                     self._create_leaf_widget(block, key, value, child_path)
 
-            # Make columns expand equally
+            # Make columns expand equally (Tk takes a list of column indices, so one call for all of them)
             max_cols = (n + max_rows - 1) // max_rows
-            for c in range(max_cols):
-                level_frame.grid_columnconfigure(c, weight=1)
+            level_frame.grid_columnconfigure(tuple(range(max_cols)), weight=1)
+
+    def _build_leaf_table(
+        self,
+        parent: ttk.Frame,
+        items: Sequence[tuple[Any, Any]],
+        path: Path,
+    ) -> None:
+        """
+        Build a read-only (key, value) table for a level that holds only non-editable leaves.
+        Rows listen on the same topics the per-leaf widgets would.
+        """
+        rows = [(str(key), value, self._listen_topic_for_path(path + (key,))) for key, value in items]
+        table = SmartLeafTable(parent=parent, rows=rows, logger=self._log)
+        table.pack(fill="x", expand=True, anchor="nw", pady=4, padx=4)
+
+    def _build_leaf_grid(
+        self,
+        parent: ttk.Frame,
+        items: Sequence[tuple[Any, Any]],
+        path: Path,
+    ) -> None:
+        """
+        Build a level that holds only leaves (some editable) as one two-column grid:
+        key label on the left, smart widget on the right, all under a single frame.
+        """
+        level_frame = ttk.Frame(parent)
+        level_frame.pack(fill="both", expand=True, anchor="nw", pady=4, padx=4)
+
+        for row, (key, value) in enumerate(items):
+            ttk.Label(level_frame, text=str(key), anchor="w").grid(row=row, column=0, sticky="nw", padx=(0, 10), pady=1)
+            widget = self._make_leaf_widget(level_frame, value, path + (key,))
+            widget.grid(row=row, column=1, sticky="ew", pady=1)
+
+        level_frame.grid_columnconfigure(1, weight=1)
 
     def _create_leaf_widget(
         self,
@@ -268,12 +354,24 @@ class DictViewerFrontend(ttk.Frame):
         """
         Create a SmartWidgetFactory-based widget for a leaf.
         """
+        widget = self._make_leaf_widget(parent, value, path)
+        widget.pack(fill="x", expand=True, anchor="w", pady=1)
+
+    def _make_leaf_widget(
+        self,
+        parent: ttk.Frame,
+        value: Any,
+        path: Path,
+    ) -> ttk.Frame:
+        """
+        Make (but don't place) the SmartWidgetFactory-based widget for a leaf.
+        """
         listen_topic_string = self._listen_topic_for_path(path)
         publish_topic_string = self._publish_topic_for_path(path)
         editable = self._is_editable(path)
 
         # The SmartWidgetFactory handles creating the label + widget and wiring pubsub.
-        widget = SmartWidgetFactory.make_connected_widget(
+        return SmartWidgetFactory.make_connected_widget(
             parent=parent,
             label_text="",
             initial_value=value,
@@ -281,5 +379,4 @@ class DictViewerFrontend(ttk.Frame):
             listen_topic_string=listen_topic_string,
             publish_topic_string=publish_topic_string,
         )
-        widget.pack(fill="x", expand=True, anchor="w", pady=1)
 
@@ -12,6 +12,7 @@ class DictViewerModule:
                     parent: ttk.Frame,
                     ui_topic_root: str = "app.ui",
                     editable_paths: Optional[Iterable[Path]] = None, 
+                    flat_reference_dict: Optional[Dict[Path, Any]] = None,
                     layout_pattern: str = "thv", 
                     ui_max_publish_rate_s: float = 0.1,
                     logger: Optional[logging.Logger] = None) -> None:
@@ -29,6 +30,7 @@ class DictViewerModule:
         #create the aggregator
         self.aggregator = DictViewerAggregator(
             reference_dict=reference_dict,
+            flat_reference_dict=flat_reference_dict,
             editable_paths=editable_paths,
             ui_topic_root=ui_topic_root,
             ui_max_publish_rate_s=ui_max_publish_rate_s,
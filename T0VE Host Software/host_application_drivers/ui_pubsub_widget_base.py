@@ -4,8 +4,12 @@ from typing import Any, Optional
 from pubsub import pub
 import copy
 import logging
+from enum import Enum
 
-from host_application_drivers.util_match_type_runtime import match_type
+from host_application_drivers.util_match_type_runtime import type_matcher
+
+# leaf value types that are immutable; updates of these can be handed to the UI thread without a copy
+_IMMUTABLE_VALUE_TYPES = (bool, int, float, str, Enum)
 
 class _SmartWidgetBase(ttk.Frame):
     """
@@ -29,8 +33,12 @@ class _SmartWidgetBase(ttk.Frame):
         self._editable = editable
 
         # Store a template/example value for strict validation, including nested/compound structures.
-        # This will be passed to `match_type` to validate both type and structure (lists, tuples, dicts, etc.).
+        # Validates both type and structure (lists, tuples, dicts, etc.); the checker is specialized once from the template.
         self._type_match_template = copy.deepcopy(initial_value)
+        self._type_matcher = type_matcher(self._type_match_template)
+
+        # decided once here rather than per update: only container values (lists/tuples) need copying on update
+        self._copy_update = not isinstance(initial_value, _IMMUTABLE_VALUE_TYPES)
 
         # get/create a logger for this instance; pass to smart widgets
         self._log = logger or logging.getLogger(__name__ + "." + self.__class__.__name__)
@@ -96,6 +104,16 @@ class _SmartWidgetBase(ttk.Frame):
         pub.sendMessage(self._publish_topic, payload=val)
 
 
+    def _set_readonly_text(self, entry: ttk.Entry, text: str) -> None:
+        """
+        Write `text` into a read-only entry that has no text variable backing it.
+        Read-only displays skip the per-widget Tcl variable; the entry is briefly unlocked to replace its text.
+        """
+        entry.configure(state="normal")
+        entry.delete(0, "end")
+        entry.insert(0, text)
+        entry.configure(state="readonly")
+
     def _validate_input_int(self, val: Any) -> bool:
         """
         Validate the input value as an integer.
@@ -156,7 +174,7 @@ class _SmartWidgetBase(ttk.Frame):
         Performs strict validation before bridging to Main Thread.
         """
         # sanity check payload type/structure against the initial example/template value
-        if not match_type(payload, self._type_match_template):
+        if not self._type_matcher(payload):
             self._log.warning(
                 f"_on_backend_update: Type mismatch on {self._listen_topic}: "
                 f"{type(payload)} does not match template type {type(self._type_match_template)}"
@@ -164,9 +182,11 @@ class _SmartWidgetBase(ttk.Frame):
             return
 
         # if type check passed, update the UI safely
-        # copy the payload to ensure any modifications to the original payload 
+        # copy (container) payloads to ensure any modifications to the original payload 
         # don't mess with the local copy
-        self.after_idle(lambda: self._safe_ui_update(copy.deepcopy(payload)))
+        if self._copy_update:
+            payload = copy.deepcopy(payload)
+        self.after_idle(lambda: self._safe_ui_update(payload))
 
     def _safe_ui_update(self, new_value):
         """Runs on Main Thread."""
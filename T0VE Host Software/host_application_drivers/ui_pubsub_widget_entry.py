@@ -2,25 +2,43 @@ import tkinter as tk
 from tkinter import ttk
 from host_application_drivers.ui_pubsub_widget_base import _SmartWidgetBase
 
+# entry text -> value cast per exact template type
+_CAST_BY_TYPE = {
+    int: int,
+    float: float,
+}
+
 '''
 Specialized widget for string/int/float values; uses a Entry widget.
 '''
 class SmartEntryWidget(_SmartWidgetBase):
     def create_ui(self, parent, initial_value):
-        self.var = tk.StringVar(value=str(initial_value))
-        state = "normal" if self._editable else "readonly"
-        
-        # register the validator for the entry widget; pass the new proposed value
-        vcmd = (self.register(self._validators[type(self._type_match_template)]), "%P")
-        
-        # create the entry widget with the validator, validating on keystroke entries
-        self.widget = ttk.Entry(parent, textvariable=self.var, state=state,
-                                validate="key", validatecommand=vcmd)
-        self.widget.pack(fill="x", expand=False, anchor="n") #TODO: change back to expand=True if I don't like
+        # cast from the entry text back to the original type, resolved once (None: strings are returned as-is)
+        self._cast = _CAST_BY_TYPE.get(type(self._type_match_template))
 
         if self._editable:
+            self.var = tk.StringVar(value=str(initial_value))
+
+            if type(self._type_match_template) is str:
+                # strings accept every keystroke, so skip the per-keystroke validator callback entirely
+                self.widget = ttk.Entry(parent, textvariable=self.var, state="normal")
+            else:
+                # register the validator for the entry widget; pass the new proposed value
+                # (int/float validate per keystroke so non-numeric text never makes it into the field)
+                vcmd = (self.register(self._validators[type(self._type_match_template)]), "%P")
+
+                # create the entry widget with the validator, validating on keystroke entries
+                self.widget = ttk.Entry(parent, textvariable=self.var, state="normal",
+                                        validate="key", validatecommand=vcmd)
             self.widget.bind("<Return>", self.publish_change)
             self.widget.bind("<FocusOut>", self.publish_change)
+        else:
+            # read-only: no text variable or validator, the text is written into the entry directly
+            self.var = None
+            self.widget = ttk.Entry(parent)
+            self._set_readonly_text(self.widget, str(initial_value))
+
+        self.widget.pack(fill="x", expand=False, anchor="n") #TODO: change back to expand=True if I don't like
 
     def update_ui(self, new_value):
         if(self._editable):
@@ -30,26 +48,18 @@ class SmartEntryWidget(_SmartWidgetBase):
                 self.var.set(str(new_value))
         else:
             # if the field is not editable, push changes immediately
-            self.var.set(str(new_value))
+            self._set_readonly_text(self.widget, str(new_value))
 
     def get_ui_value(self):
-        val_str = self.var.get()
-        
+        val_str = self.var.get() if self.var is not None else self.widget.get()
+        if self._cast is None:
+            return val_str
+
         # explicit casting to original type; 
-        if type(self._type_match_template) is int:
-            try:
-                return int(val_str)
-            except ValueError:
-                self._log.warning(f"Invalid int value: {val_str}")
-                return None #invalid int, subscriber should be graceful enough to handle error
-
-        elif type(self._type_match_template) is float:
-            try:
-                return float(val_str)
-            except ValueError:
-                self._log.warning(f"Invalid float value: {val_str}")
-                return None #invalid float, subscriber should be graceful enough to handle error
-            
-        return val_str
+        try:
+            return self._cast(val_str)
+        except ValueError:
+            self._log.warning(f"Invalid {self._cast.__name__} value: {val_str}")
+            return None #invalid int/float, subscriber should be graceful enough to handle error
 
 
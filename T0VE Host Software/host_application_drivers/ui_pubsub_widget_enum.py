@@ -11,22 +11,27 @@ class SmartEnumWidget(_SmartWidgetBase):
         self.enum_cls = type(self._type_match_template)
         self.options = [e.name for e in self.enum_cls]
         
-        self.var = tk.StringVar(value=initial_value.name)
-        
         if self._editable:
+            self.var = tk.StringVar(value=initial_value.name)
             self.widget = ttk.Combobox(parent, textvariable=self.var, values=self.options, state="readonly")
             self.widget.bind("<<ComboboxSelected>>", self.publish_change)
         else:
-            self.widget = ttk.Entry(parent, textvariable=self.var, state="readonly")
+            # read-only: no text variable, the name is written into the entry directly
+            self.var = None
+            self.widget = ttk.Entry(parent)
+            self._set_readonly_text(self.widget, initial_value.name)
             
         self.widget.pack(fill="x", expand=False, anchor="n") #TODO: change back to expand=True if I don't like
 
     def update_ui(self, new_value):
         if isinstance(new_value, self.enum_cls):
-            self.var.set(new_value.name)
+            if self.var is not None:
+                self.var.set(new_value.name)
+            else:
+                self._set_readonly_text(self.widget, new_value.name)
 
     def get_ui_value(self):
-        name = self.var.get()
+        name = self.var.get() if self.var is not None else self.widget.get()
         try:
             return self.enum_cls[name] # Raises KeyError if invalid name
         except KeyError:
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
 from enum import Enum
-from typing import Any, Tuple, List, Optional
+from typing import Any, Dict, Tuple, List, Optional, Type
 import logging
 
 #widget specialization imports
@@ -9,7 +9,48 @@ from host_application_drivers.ui_pubsub_widget_base import _SmartWidgetBase
 from host_application_drivers.ui_pubsub_widget_bool import SmartBoolWidget
 from host_application_drivers.ui_pubsub_widget_enum import SmartEnumWidget
 from host_application_drivers.ui_pubsub_widget_entry import SmartEntryWidget
-from host_application_drivers.ui_pubsub_widget_list import SmartListFrame
+from host_application_drivers.ui_pubsub_widget_list import SmartListFrame, SmartListLabel
+
+# read-only lists up to this length are shown on one line (`SmartListLabel`) instead of one row per element
+COMPACT_LIST_MAX_LEN = 20
+
+# widget class per exact value type; seeded with the plain types, other types are resolved once and memoized
+# None caches "unsupported" so those types skip the resolution too
+_WIDGET_BY_TYPE: Dict[type, Optional[Type[_SmartWidgetBase]]] = {
+    list: SmartListFrame,
+    tuple: SmartListFrame,
+    bool: SmartBoolWidget,
+    int: SmartEntryWidget,
+    float: SmartEntryWidget,
+    str: SmartEntryWidget,
+}
+
+def _widget_class_for(value: Any) -> Optional[Type[_SmartWidgetBase]]:
+    '''
+    Return the widget class that handles `value`, or None if its type isn't supported.
+    Exact types hit the dispatch dict directly; anything else (enums, subclasses) goes through
+    the ordered isinstance checks below on first sight, and the result is cached for its type.
+    '''
+    value_type = type(value)
+    try:
+        return _WIDGET_BY_TYPE[value_type]
+    except KeyError:
+        pass
+
+    # order matters: enums before primitives (IntEnum is an int), bool before int (bool is an int)
+    if isinstance(value, (list, tuple)):
+        widget_cls = SmartListFrame         # 1. Lists/Tuples (Recursive/Composite Widget)
+    elif isinstance(value, Enum):
+        widget_cls = SmartEnumWidget        # 2. Enums
+    elif isinstance(value, bool):
+        widget_cls = SmartBoolWidget        # 3. Booleans
+    elif isinstance(value, (int, float, str)):
+        widget_cls = SmartEntryWidget       # 4. Standard Primitives (Int, Float, String)
+    else:
+        widget_cls = None
+
+    _WIDGET_BY_TYPE[value_type] = widget_cls
+    return widget_cls
 
 class SmartWidgetFactory:
     """
@@ -30,45 +71,21 @@ class SmartWidgetFactory:
         # get/create a logger for this instance; pass to smart
         logger = logger or logging.getLogger(__name__ + ".SmartWidgetFactory")
 
-        # 1. Handle Lists/Tuples (Recursive/Composite Widget)
-        if isinstance(initial_value, (list, tuple)):
-            return SmartListFrame(  parent=parent, 
-                                    label_text=label_text, 
-                                    initial_value=initial_value, 
-                                    editable=editable, 
-                                    listen_topic_string=listen_topic_string, 
-                                    publish_topic_string=publish_topic_string,
-                                    logger=logger)
-
-        # 2. Handle Enums
-        if isinstance(initial_value, Enum):
-            return SmartEnumWidget( parent=parent, 
-                                    label_text=label_text, 
-                                    initial_value=initial_value, 
-                                    editable=editable, 
-                                    listen_topic_string=listen_topic_string, 
-                                    publish_topic_string=publish_topic_string,
-                                    logger=logger)
+        # look up the widget class for this value's type (see `_widget_class_for`)
+        widget_cls = _widget_class_for(initial_value)
 
-        # 3. Handle Booleans
-        if isinstance(initial_value, bool):
-            return SmartBoolWidget( parent=parent, 
-                                    label_text=label_text, 
-                                    initial_value=initial_value, 
-                                    editable=editable, 
-                                    listen_topic_string=listen_topic_string, 
-                                    publish_topic_string=publish_topic_string,
-                                    logger=logger)
+        # short read-only lists don't need per-element child widgets
+        if widget_cls is SmartListFrame and not editable and len(initial_value) <= COMPACT_LIST_MAX_LEN:
+            widget_cls = SmartListLabel
 
-        # 4. Handle Standard Primitives (Int, Float, String)
-        if isinstance(initial_value, (int, float, str)):
-            return SmartEntryWidget(parent=parent, 
-                                    label_text=label_text, 
-                                    initial_value=initial_value, 
-                                    editable=editable, 
-                                    listen_topic_string=listen_topic_string, 
-                                    publish_topic_string=publish_topic_string,
-                                    logger=logger)
+        if widget_cls is not None:
+            return widget_cls(  parent=parent, 
+                                label_text=label_text, 
+                                initial_value=initial_value, 
+                                editable=editable, 
+                                listen_topic_string=listen_topic_string, 
+                                publish_topic_string=publish_topic_string,
+                                logger=logger)
 
         # Fallback for unknown types
         f = ttk.Frame(parent)
@@ -2,6 +2,15 @@ import tkinter as tk
 from tkinter import ttk
 from host_application_drivers.ui_pubsub_widget_base import _SmartWidgetBase
 
+# `SmartListFrame` child widget builder (method name) per exact element type
+# (bool is its own key, so it never falls into the int entry; the entry validators are keyed by type(value) too)
+_CHILD_MAKERS = {
+    bool: "_make_bool_child",
+    int: "_make_entry_child",
+    float: "_make_entry_child",
+    str: "_make_entry_child",
+}
+
 '''
 Specialized widget for list/tuple values; uses a Frame widget.
 '''
@@ -22,39 +31,50 @@ class SmartListFrame(_SmartWidgetBase):
         self.current_value = initial_value
 
     def _make_child_widget(self, parent, value, index):
+        # pick the child builder by exact type (one dict lookup per element, see `_CHILD_MAKERS` above)
+        # anything we don't support just gets a label and string cast
+        make = getattr(self, _CHILD_MAKERS.get(type(value), "_make_label_child"))
+        w = make(parent, value, index)
+        
+        # if the widget is not editable, set the state to disabled
+        if not self._editable and hasattr(w, 'state'):
+            w.state(['disabled'])
+        return w
+
+    def _make_bool_child(self, parent, value, index):
         #booleans get a check button
-        if isinstance(value, bool):
-            var = tk.BooleanVar(value=value)
-            w = ttk.Checkbutton(parent, variable=var, 
-                                command=lambda: self._on_child_change(index, var.get()))
-            w.var = var
+        var = tk.BooleanVar(value=value)
+        w = ttk.Checkbutton(parent, variable=var, 
+                            command=lambda: self._on_child_change(index, var.get()))
+        w.var = var
+        return w
 
+    def _make_entry_child(self, parent, value, index):
         # int/float/str get an entry widget
-        elif isinstance(value, (int, float, str)):
-            var = tk.StringVar(value=str(value))
-            
-            # register the validator for the entry widget; pass the new proposed value
-            target_type = type(value)
+        var = tk.StringVar(value=str(value))
+        
+        # register the validator for the entry widget; pass the new proposed value
+        # (strings accept every keystroke, so they skip the per-keystroke validator callback)
+        target_type = type(value)
+        if target_type is str:
+            w = ttk.Entry(parent, textvariable=var)
+        else:
             vcmd = (self.register(self._validators[target_type]), '%P')
-            
+
             # create the entry widget with the validator, validating on keystroke entries
             w = ttk.Entry(parent, textvariable=var, validate="key", validatecommand=vcmd)
-            
-            # fire off this lambda functions on the return and focus out events; calls the `on_child_change` method
-            cmd = lambda e: self._on_child_change(index, var.get(), target_type)
-            w.bind("<Return>", cmd)
-            w.bind("<FocusOut>", cmd)
-            w.var = var
-        
-        # if it's something else we don't support, just create a label and string cast
-        else:
-            w = ttk.Label(parent, text=str(value))
         
-        # if the widget is not editable, set the state to disabled
-        if not self._editable and hasattr(w, 'state'):
-            w.state(['disabled'])
+        # fire off this lambda functions on the return and focus out events; calls the `on_child_change` method
+        cmd = lambda e: self._on_child_change(index, var.get(), target_type)
+        w.bind("<Return>", cmd)
+        w.bind("<FocusOut>", cmd)
+        w.var = var
         return w
 
+    def _make_label_child(self, parent, value, index):
+        # if it's something else we don't support, just create a label and string cast
+        return ttk.Label(parent, text=str(value))
+
     '''
     Normally, we'd directly bind the change event to the publish_change method.
     However, since we're a composite element that represents just a single variable, we 
@@ -98,7 +118,7 @@ class SmartListFrame(_SmartWidgetBase):
             if hasattr(widget, 'var'):
                 # get the value from the new value list at the corresponding index
                 val = self.current_value[i]
-                if isinstance(val, bool):
+                if type(val) is bool:
                      widget.var.set(val)
                 else:
                     # if the widget has focus, don't update the value (don't overwrite the user input)
@@ -107,4 +127,27 @@ class SmartListFrame(_SmartWidgetBase):
 
     def get_ui_value(self):
         # return the current value of the aggregate state
-        return self.current_value
\ No newline at end of file
+        return self.current_value
+
+
+'''
+Compact read-only widget for short list/tuple values; uses a single Label widget.
+Shows the elements comma-joined on one line instead of building a row (frame + index label + child) per element.
+'''
+class SmartListLabel(_SmartWidgetBase):
+    def create_ui(self, parent, initial_value):
+        self.widget = ttk.Label(parent, text=self._format(initial_value), anchor="w")
+        self.widget.pack(fill="x", expand=False, anchor="n") #TODO: change back to expand=True if I don't like
+        self.current_value = initial_value
+
+    @staticmethod
+    def _format(value):
+        return ", ".join(map(str, value))
+
+    def update_ui(self, new_value):
+        self.current_value = new_value
+        self.widget.configure(text=self._format(new_value))
+
+    def get_ui_value(self):
+        # read-only, never publishes; report the last value shown
+        return self.current_value
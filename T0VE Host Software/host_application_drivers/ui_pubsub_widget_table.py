@@ -0,0 +1,97 @@
+from tkinter import ttk
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+from pubsub import pub
+import copy
+import logging
+
+from host_application_drivers.util_match_type_runtime import type_matcher
+from host_application_drivers.ui_pubsub_widget_list import SmartListLabel
+
+# checkbox glyphs standing in for the (disabled) check button a read-only bool would otherwise get
+_BOOL_TEXT = {True: "\u2611", False: "\u2610"}
+
+def _format_leaf(value: Any) -> str:
+    '''
+    row text for a leaf, matching what the per-leaf widget it replaces would show:
+    enum names (`SmartEnumWidget`), checkbox glyphs for bools (`SmartBoolWidget`),
+    comma-joined lists (`SmartListLabel`), plain `str` for everything else (`SmartEntryWidget`)
+    '''
+    value_type = type(value)
+    if value_type is bool:
+        return _BOOL_TEXT[value]
+    if value_type in (list, tuple):
+        return SmartListLabel._format(value)
+    if isinstance(value, Enum):
+        return value.name
+    return str(value)
+
+'''
+Read-only table for a block of leaf values; uses a single Treeview widget.
+Each row is a Tcl-side Treeview item rather than its own Frame/Label/Entry, so large
+read-only blocks cost one widget instead of several per leaf.
+Rows listen to their own pubsub topic, just like the per-leaf smart widgets.
+'''
+class SmartLeafTable(ttk.Frame):
+    def __init__(   self,
+                    *,
+                    parent: ttk.Frame,
+                    rows: Sequence[Tuple[str, Any, str]],
+                    logger: Optional[logging.Logger] = None,
+                    **kwargs) -> None:
+        '''
+        `rows` holds (label, initial value, listen topic string) for every leaf in the block, in display order
+        '''
+        super().__init__(parent, **kwargs)
+        self._log = logger or logging.getLogger(__name__ + "." + self.__class__.__name__)
+
+        # one Treeview for the whole block: key in the tree column, value in the single data column
+        # sized to its rows so it never scrolls on its own (the enclosing scrollable frame does that)
+        self.tree = ttk.Treeview(self, columns=("value",), show="tree", height=len(rows), selectmode="none")
+        self.tree.column("#0", width=160, stretch=False, anchor="w")
+        self.tree.column("value", width=140, stretch=True, anchor="w")
+        self.tree.pack(fill="x", expand=True, anchor="n")
+
+        # per-topic row id + type template/checker (same strict type checking as the smart widgets)
+        self._row_for_topic: Dict[str, str] = {}
+        self._template_for_topic: Dict[str, Any] = {}
+        self._type_matcher_for_topic: Dict[str, Callable[[Any], bool]] = {}
+        for label, initial_value, listen_topic in rows:
+            iid = self.tree.insert("", "end", text=label, values=(_format_leaf(initial_value),))
+            self._row_for_topic[listen_topic] = iid
+            self._template_for_topic[listen_topic] = copy.deepcopy(initial_value)
+            self._type_matcher_for_topic[listen_topic] = type_matcher(self._template_for_topic[listen_topic])
+            pub.subscribe(self._on_backend_update, listen_topic)
+
+        # Ensure we unsubscribe when the widget is destroyed
+        self.bind("<Destroy>", self._on_destroy)
+
+    def _on_backend_update(self, payload=None, topic=pub.AUTO_TOPIC):
+        """
+        Listener for Pypubsub. Runs in Backend Thread.
+        Performs strict validation before bridging to Main Thread.
+        """
+        topic_name = topic.getName()
+        template = self._template_for_topic.get(topic_name)
+        if template is None:
+            return
+
+        # sanity check payload type/structure against the initial example/template value
+        if not self._type_matcher_for_topic[topic_name](payload):
+            self._log.warning(
+                f"_on_backend_update: Type mismatch on {topic_name}: "
+                f"{type(payload)} does not match template type {type(template)}"
+            )
+            return
+
+        # render the text here (the payload may be mutated after we return), then set it on the Main Thread
+        iid = self._row_for_topic[topic_name]
+        text = _format_leaf(payload)
+        self.after_idle(lambda: self.tree.set(iid, "value", text))
+
+    def _on_destroy(self, event):
+        # <Destroy> also fires for the child Treeview; only tear down once, for ourselves
+        if event.widget is not self:
+            return
+        for listen_topic in self._row_for_topic:
+            pub.unsubscribe(self._on_backend_update, listen_topic)
@@ -31,11 +31,21 @@ class ScrollableFrame(ttk.Frame):
         self._interior_id = self._canvas.create_window((0, 0), window=self._interior, anchor="nw")
 
         # Configure scrollregion
+        # (recomputed at most once per idle cycle; the interior reconfigures repeatedly while it's being populated)
+        self._scrollregion_pending = False
         self._interior.bind("<Configure>", self._on_interior_configure)
         self._canvas.bind("<Configure>", self._on_canvas_configure)
 
     def _on_interior_configure(self, event):
+        # Schedule a scroll region update, unless one is already waiting for the next idle cycle
+        if self._scrollregion_pending:
+            return
+        self._scrollregion_pending = True
+        self._canvas.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
         # Update scroll region to encompass the inner frame
+        self._scrollregion_pending = False
         self._canvas.configure(scrollregion=self._canvas.bbox("all"))
 
     def _on_canvas_configure(self, event):
@@ -4,14 +4,18 @@ class FlatDict:
     @staticmethod
     def flatten(nested: Dict[Any, Any]) -> Dict[Tuple[Any, ...], Any]:
         flat = {}
+        FlatDict._flatten_into(nested, (), flat)
+        return flat
+
+    @staticmethod
+    def _flatten_into(nested: Dict[Any, Any], prefix: Tuple[Any, ...], flat: Dict[Tuple[Any, ...], Any]) -> None:
+        # writes leaves straight into the one output dict; no per-level intermediate dicts/re-keying
         for key, value in nested.items():
-            if isinstance(value, dict):
-                children = FlatDict.flatten(value)
-                for child_key, child_value in children.items():
-                    flat[(key, *child_key)] = child_value
+            path = prefix + (key,)
+            if type(value) is dict or isinstance(value, dict):
+                FlatDict._flatten_into(value, path, flat)
             else:
-                flat[(key,)] = value
-        return flat
+                flat[path] = value
 
     @staticmethod
     def unflatten(flat: Dict[Tuple[Any, ...], Any]) -> Dict[Any, Any]:
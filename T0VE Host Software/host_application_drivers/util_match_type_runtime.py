@@ -1,6 +1,6 @@
 
 
-from typing import Any
+from typing import Any, Callable
 
 
 def match_type(value: Any, example: Any) -> bool:
@@ -45,3 +45,50 @@ def match_type(value: Any, example: Any) -> bool:
     # and our first type check will filter out data primitives
     # so we can just return true
     return True
+
+
+def type_matcher(example: Any) -> Callable[[Any], bool]:
+    '''
+    Build a checker equivalent to `lambda value: match_type(value, example)`, specialized once for `example`
+    Container structure (keys, lengths, element types) is resolved up front, so repeated checks against the
+    same example (e.g. every publish to a given topic) don't re-walk the example or recurse through `match_type`
+    '''
+    # same type-as-example handling as `match_type`
+    if isinstance(example, type):
+        example = example()
+    example_type = type(example)
+
+    # dictionaries: fixed key set, one checker per key
+    if isinstance(example, dict):
+        keys = set(example.keys())
+        item_matchers = tuple((key, type_matcher(item)) for key, item in example.items())
+        def _match_dict(value: Any) -> bool:
+            if not isinstance(value, example_type) or value.keys() != keys:
+                return False
+            return all(matcher(value[key]) for key, matcher in item_matchers)
+        return _match_dict
+
+    # lists/tuples: fixed length, one checker per element
+    if isinstance(example, (list, tuple)):
+        length = len(example)
+        element_types = {type(element) for element in example}
+        # common case--a flat array of one primitive type; a single isinstance per element
+        if len(element_types) == 1 and not issubclass(next(iter(element_types)), (dict, list, tuple, type)):
+            element_type = next(iter(element_types))
+            def _match_flat_sequence(value: Any) -> bool:
+                if not isinstance(value, example_type) or len(value) != length:
+                    return False
+                return all(isinstance(element, element_type) for element in value)
+            return _match_flat_sequence
+
+        element_matchers = tuple(type_matcher(element) for element in example)
+        def _match_sequence(value: Any) -> bool:
+            if not isinstance(value, example_type) or len(value) != length:
+                return False
+            return all(matcher(element) for matcher, element in zip(element_matchers, value))
+        return _match_sequence
+
+    # data primitives: the top-level type check is all `match_type` does
+    def _match_primitive(value: Any) -> bool:
+        return isinstance(value, example_type)
+    return _match_primitive
@@ -0,0 +1,147 @@
+
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import betterproto
+from betterproto import Casing, TYPE_MESSAGE, TYPE_FLOAT, TYPE_DOUBLE, TYPE_ENUM, TYPE_MAP, TYPE_BYTES, INT_64_TYPES
+
+# how each field is copied into the output dictionary
+_COPY_VALUE = 0     #scalars/strings/optionals, copied as-is
+_COPY_LIST = 1      #repeated scalars, shallow copied
+                    #(state schema arrays are fixed-count, 10 elements at most per app_messages.options, so plain lists
+                    # stay cheap; no numpy/raw packed-buffer path is warranted)
+_COPY_FLOAT = 2     #floats, non-finite values turned into their JSON strings
+_COPY_MESSAGE = 3   #nested messages, walked recursively (None stays None)
+
+# per message class field plan: (field name, camelCase key, copy kind)
+# None if the class uses a field type we don't walk ourselves (falls back to betterproto `to_dict`)
+_FieldPlan = Optional[List[Tuple[str, str, int]]]
+
+# per message class converter, generated from its field plan on first use (see `_compile_converter`)
+_Converter = Callable[[betterproto.Message], Dict[str, Any]]
+_CONVERTERS: Dict[type, _Converter] = {}
+
+
+def proto_to_dict(message: betterproto.Message) -> Dict[str, Any]:
+    '''
+    Convert a betterproto message into a nested dictionary.
+    Produces the same output as `message.to_dict(include_default_values=True)`, i.e.
+    camelCase keys and every field present, but runs a converter generated once per message class
+    (straight-line field reads, no per-field type inspection) instead of re-inspecting
+    type hints and field metadata on every call.
+    Message classes with field types outside the plan (enums, 64-bit ints, bytes, maps,
+    well-known types, repeated messages, oneofs) are handed to betterproto's `to_dict` as-is.
+    '''
+    cls = type(message)
+    try:
+        converter = _CONVERTERS[cls]
+    except KeyError:
+        converter = _converter_for(cls)
+    return converter(message)
+
+
+def _converter_for(cls: type, pending: Optional[Dict[type, _Converter]] = None) -> _Converter:
+    #return the cached converter for a message class, generating it (and its sub-message converters) if needed
+    #converters being generated live in `pending` and only go into `_CONVERTERS` once the whole batch is done,
+    #so another thread converting concurrently never finds a half-built entry (it just generates its own)
+    try:
+        return _CONVERTERS[cls]
+    except KeyError:
+        pass
+
+    top_level = pending is None
+    if top_level:
+        pending = {}
+    elif cls in pending:
+        return pending[cls]
+
+    plan = _build_plan(cls)
+    if plan is None:
+        converter = _to_dict_fallback
+    else:
+        #register the generic entry point first, so a message type that (indirectly) contains itself
+        #resolves to `proto_to_dict` while its own converter is still being generated
+        pending[cls] = proto_to_dict
+        converter = _compile_converter(cls, plan, pending)
+    pending[cls] = converter
+
+    if top_level:
+        _CONVERTERS.update(pending)
+    return converter
+
+
+def _to_dict_fallback(message: betterproto.Message) -> Dict[str, Any]:
+    return message.to_dict(include_default_values=True)
+
+
+def _compile_converter(cls: type, plan: List[Tuple[str, str, int]], pending: Dict[type, _Converter]) -> _Converter:
+    '''
+    Generate the converter source for one message class from its field plan and compile it.
+    The schema is fixed at build time, so every field read, key and sub-message converter is baked in, e.g.
+        def _to_dict_Comms(m):
+            d = m.__dict__
+            v0 = d.get('status', _PH)
+            if v0 is _PH: v0 = m.status
+            v1 = d.get('allow_connection', _PH)
+            if v1 is _PH: v1 = m.allow_connection
+            return {
+                'status': None if v0 is None else _sub0(v0),
+                'allowConnection': v1,
+            }
+    Fields are read straight from the instance dict: betterproto's `__getattribute__` override (the bulk of
+    `to_dict`'s cost) only matters for oneof members, which a plan never has, and for fields still holding
+    the lazy-default placeholder, which fall back to the regular attribute read.
+    '''
+    namespace: Dict[str, Any] = {"_dump_float": betterproto._dump_float, "_PH": betterproto.PLACEHOLDER, "list": list}
+    reads: List[str] = ["    d = m.__dict__"]
+    items: List[str] = []
+    for i, (field_name, key, kind) in enumerate(plan):
+        reads.append(f"    v{i} = d.get({field_name!r}, _PH)")
+        reads.append(f"    if v{i} is _PH: v{i} = m.{field_name}")
+        if kind == _COPY_VALUE:
+            items.append(f"        {key!r}: v{i},")
+        elif kind == _COPY_LIST:
+            items.append(f"        {key!r}: list(v{i}),")
+        elif kind == _COPY_FLOAT:
+            items.append(f"        {key!r}: _dump_float(v{i}),")
+        else:
+            namespace[f"_sub{i}"] = _converter_for(cls._betterproto.cls_by_field[field_name], pending)
+            items.append(f"        {key!r}: None if v{i} is None else _sub{i}(v{i}),")
+
+    func_name = f"_to_dict_{cls.__name__}"
+    source = "\n".join([f"def {func_name}(m):", *reads, "    return {", *items, "    }"])
+    exec(compile(source, f"<proto_to_dict {cls.__qualname__}>", "exec"), namespace)
+    return namespace[func_name]
+
+
+def _build_plan(cls: type) -> _FieldPlan:
+    #build the field plan for a message class, or None if it needs the general betterproto path
+    meta_data = cls._betterproto
+    plan: List[Tuple[str, str, int]] = []
+    for field_name, meta in meta_data.meta_by_field_name.items():
+        repeated = meta_data.default_gen[field_name] is list
+        key = Casing.CAMEL(field_name).rstrip("_")
+
+        #field types betterproto transforms on the way out, leave those to it
+        if meta.proto_type in (TYPE_ENUM, TYPE_MAP, TYPE_BYTES) or meta.proto_type in INT_64_TYPES or meta.wraps:
+            return None
+
+        #oneof members raise on read unless they're the active one; betterproto substitutes defaults for those
+        if meta.group is not None:
+            return None
+
+        if meta.proto_type == TYPE_MESSAGE:
+            #timestamps/durations and repeated messages also need the general path
+            sub_cls = meta_data.cls_by_field[field_name]
+            if repeated or not issubclass(sub_cls, betterproto.Message):
+                return None
+            plan.append((field_name, key, _COPY_MESSAGE))
+        elif meta.proto_type in (TYPE_FLOAT, TYPE_DOUBLE):
+            if repeated:
+                return None
+            plan.append((field_name, key, _COPY_FLOAT))
+        elif repeated:
+            plan.append((field_name, key, _COPY_LIST))
+        else:
+            plan.append((field_name, key, _COPY_VALUE))
+    return plan
@@ -51,6 +51,7 @@ if __name__ == "__main__":
 
     #create our Tkinter window
     root = tk.Tk()
+    root.withdraw()     #build off-screen, show once laid out (see below)
     root.title("Dict Viewer Test")
 
     scrollable_frame = ScrollableFrame(root)
@@ -67,4 +68,6 @@ if __name__ == "__main__":
     )
     dict_viewer.frontend.pack(fill="both", expand=True)
 
+    root.update_idletasks()
+    root.deiconify()
     root.mainloop()
\ No newline at end of file